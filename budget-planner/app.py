@@ -3,14 +3,27 @@ from tkinter import ttk, messagebox, simpledialog, filedialog
 import json
 import os
 import csv
+import io
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import OrderedDict
+from importlib.util import find_spec
+from functools import lru_cache
 import re
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
 import numpy as np
 
+try:
+    import orjson  # optional: deutlich schnelleres Serialisieren der Monatsdateien
+except ImportError:
+    orjson = None
+
+# reportlab wird erst beim ersten PDF-Export importiert - hier nur prüfen, ob es installiert ist
+HAS_REPORTLAB = find_spec("reportlab") is not None
+
 # ------------------------------
 # Konfiguration / Standard-Daten
 # ------------------------------
@@ -32,51 +45,161 @@ DEFAULT_STRUCTURE = {
     }
 }
 
+CATEGORY_ICONS = {
+    "Einnahmen": "💰",
+    "Fixkosten": "🏠",
+    "Variable Kosten": "🛒",
+    "Sparen": "🎯"
+}
+
 BASE_FOLDER = "profiles"
 DEFAULT_PROFILE = "default"
 SETTINGS_FILE = "settings.json"
+MONTH_CACHE_SIZE = 24
+RECALC_DELAY_MS = 80
+PRETTY_MONTH_FILES = False  # zum Debuggen: Monatsdateien eingerückt schreiben
+SCROLL_BINDTAG = "BudgetScroll"
+WRITE_ERROR_POLL_MS = 500
+IO_WORKERS = 8
+
+_MONTH_FILE_RE = re.compile(r'^budget_(\d{4}-\d{2})\.json$')
 
 # ------------------------------
 # Hilfsfunktionen
 # ------------------------------
+def parse_month(ym_str):
+    """Zerlegt YYYY-MM (auch YYYY-M) in (Jahr, Monat), None bei ungültigem Format"""
+    # feste Positionen statt Regex: 4 Ziffern, Bindestrich, 1-2 Ziffern
+    if not isinstance(ym_str, str) or len(ym_str) not in (6, 7) or ym_str[4] != '-':
+        return None
+    year, month = ym_str[:4], ym_str[5:]
+    if not (year.isdecimal() and month.isdecimal()):
+        return None
+    return int(year), int(month)
+
 def validate_month_format(ym_str):
     """Validiert YYYY-MM Format"""
-    pattern = r'^\d{4}-\d{2}$'
-    if not re.match(pattern, ym_str):
-        return False
-    try:
-        year, month = map(int, ym_str.split('-'))
-        return 1 <= month <= 12 and 1900 <= year <= 2100
-    except:
+    parsed = parse_month(ym_str)
+    if not parsed or len(ym_str) != 7:  # gespeichert wird nur mit zweistelligem Monat
         return False
+    year, month = parsed
+    return 1 <= month <= 12 and 1900 <= year <= 2100
+
+def shift_month(ym_str, delta):
+    """Verschiebt einen Monat um delta Monate (fortlaufender Monatsindex, ohne Verzweigung)"""
+    parsed = parse_month(ym_str)
+    if not parsed:
+        return None
+    year, month = divmod(parsed[0] * 12 + parsed[1] - 1 + delta, 12)
+    return f"{year}-{month + 1:02d}"
 
 def get_previous_month(ym_str):
     """Gibt den vorherigen Monat zurück"""
-    try:
-        year, month = map(int, ym_str.split('-'))
-        if month == 1:
-            return f"{year-1}-12"
-        else:
-            return f"{year}-{month-1:02d}"
-    except:
-        return None
+    return shift_month(ym_str, -1)
 
 def get_next_month(ym_str):
     """Gibt den nächsten Monat zurück"""
-    try:
-        year, month = map(int, ym_str.split('-'))
-        if month == 12:
-            return f"{year+1}-01"
-        else:
-            return f"{year}-{month+1:02d}"
-    except:
-        return None
+    return shift_month(ym_str, 1)
+
+def previous_months(ym_str, count):
+    """Liste aus ym_str und den count-1 Monaten davor (neuester zuerst), in einem Durchlauf"""
+    months = []
+    month = ym_str
+    while month and len(months) < count:
+        months.append(month)
+        month = get_previous_month(month)
+    return months
+
+@lru_cache(maxsize=64)
+def lighten_color(color):
+    """Hellt eine Farbe auf"""
+    color = color.lstrip('#')
+    r, g, b = tuple(int(color[i:i+2], 16) for i in (0, 2, 4))
+    r = min(255, r + 20)
+    g = min(255, g + 20)
+    b = min(255, b + 20)
+    return f'#{r:02x}{g:02x}{b:02x}'
+
+def copy_structure(structure):
+    """Eigenständige Kopie einer Kategorienstruktur {Haupt: {Unter: [Posten]}} in einem Durchlauf"""
+    return {mc: {sc: list(items) for sc, items in subs.items()} for mc, subs in structure.items()}
+
+KIND_INCOME, KIND_FIXED, KIND_VARIABLE = 0, 1, 2
+
+def category_kind(mc):
+    """Ordnet eine Hauptkategorie Einnahmen, Fixkosten oder variablen Kosten zu"""
+    if "Einnahmen" in mc or mc.lower().startswith("ein"):
+        return KIND_INCOME
+    if "Fix" in mc or mc.lower().startswith("fix"):
+        return KIND_FIXED
+    # Variable Kosten, Sparen und alles andere zählen als variable Ausgaben
+    return KIND_VARIABLE
+
+def category_icon(mc):
+    """Icon einer Hauptkategorie - Standardkategorien per Lookup, eigene nach Namensbestandteil"""
+    icon = CATEGORY_ICONS.get(mc)
+    if icon is None:
+        icon = "💰" if "Einnahmen" in mc else "🏠" if "Fix" in mc else "🛒" if "Variable" in mc else "🎯"
+    return icon
+
+def linear_trend(y):
+    """Steigung und Achsenabschnitt der Ausgleichsgeraden über x = 0..n-1, je Spalte von y (geschlossene Form)"""
+    y = np.asarray(y, dtype=np.float64)
+    x = np.arange(len(y), dtype=np.float64)
+    xc = x - x.mean()
+    slope = xc @ (y - y.mean(axis=0)) / (xc @ xc)
+    return slope, y.mean(axis=0) - slope * x.mean()
+
+def sum_by_group(values, groups, n_groups):
+    """Summiert Beträge je Gruppen-ID in einem Durchlauf"""
+    return np.bincount(groups, weights=values, minlength=n_groups)
+
+def valid_month_payload(data):
+    """Prüft, ob Monatsdaten die Form {values: {Haupt: {Unter: {Posten: {...}}}}} haben, die month_totals erwartet"""
+    if not isinstance(data, dict):
+        return False
+    values = data.get('values', {})
+    return isinstance(values, dict) and all(
+        isinstance(subs, dict) and all(
+            isinstance(items, dict) and all(isinstance(val, dict) for val in items.values())
+            for items in subs.values())
+        for subs in values.values())
+
+def month_totals(payloads):
+    """Einnahmen- und Ausgabensummen je Monat als Float-Arrays (ein Eintrag pro Monatsdatei)"""
+    rows, amounts, is_income = [], [], []
+    for i, data in enumerate(payloads):
+        for mc, subs in data.get('values', {}).items():
+            income = "Einnahmen" in mc
+            for items in subs.values():
+                for val in items.values():
+                    rows.append(i)
+                    amounts.append(ensure_float(val.get('amount', 0)))
+                    is_income.append(income)
+    totals = np.zeros((len(payloads), 2))  # Spalte 0: Ausgaben, Spalte 1: Einnahmen
+    np.add.at(totals, (np.array(rows, dtype=np.intp), np.array(is_income, dtype=np.intp)),
+              np.array(amounts, dtype=np.float64))
+    return totals[:, 1], totals[:, 0]
 
 def month_key_from_selection(ym_str):
+    """Monatsschlüssel aus der Eingabe, ohne umgebende Leerzeichen"""
     return ym_str.strip()
 
+@lru_cache(maxsize=4096)
+def _parse_amount(s):
+    """Parst einen Betrags-String - zwischengespeichert, da sich die Eingaben selten ändern"""
+    s = s.strip().replace(',', '.')
+    if s == "":
+        return 0.0
+    try:
+        return float(s)
+    except ValueError:
+        return 0.0
+
 def ensure_float(s):
     """Konvertiert String zu Float mit Fehlerbehandlung"""
+    if isinstance(s, str):
+        return _parse_amount(s)
     try:
         s = str(s).strip().replace(',', '.')
         if s == "":
@@ -85,10 +208,126 @@ def ensure_float(s):
     except (ValueError, AttributeError):
         return 0.0
     
+def read_csv_text(path):
+    """Liest eine Konto-CSV einmal komplett ein (UTF-8 mit/ohne BOM, sonst Latin-1)"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    try:
+        return raw.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return raw.decode('latin-1')
+
+_BANK_AMOUNT_TABLE = str.maketrans({'.': None, ',': '.'})  # 1.234,50 -> 1234.50
+
+def bank_amounts(rows, amount_idx, min_len):
+    """Parst die Betragsspalte (Format 1.234,50) aller ausreichend langen Zeilen in ein Float-Array"""
+    values = []
+    for row in rows:
+        if len(row) < min_len:
+            continue
+        s = row[amount_idx].strip().translate(_BANK_AMOUNT_TABLE)
+        try:
+            values.append(float(s) if s else 0.0)
+        except ValueError:
+            values.append(0.0)
+    return np.array(values, dtype=np.float64)
+
 def ensure_dir(path):
     """Erstellt Verzeichnis falls nicht vorhanden"""
-    if not os.path.exists(path):
-        os.makedirs(path)
+    os.makedirs(path, exist_ok=True)
+
+def encode_json(obj, pretty=False, sort_keys=False):
+    """Serialisiert JSON - eingerückt nur für Einstellungen, Monatsdaten kompakt"""
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 if pretty else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+    fmt = {'indent': 2} if pretty else {'separators': (',', ':')}
+    return json.dumps(obj, ensure_ascii=False, sort_keys=sort_keys, **fmt).encode('utf-8')
+
+def decode_json(data):
+    """Parst JSON aus Bytes - mit orjson, falls installiert"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def write_atomic(path, data, sync=False):
+    """Schreibt Bytes über eine temporäre Datei, damit nie eine halbe Datei liegen bleibt"""
+    tmp = path + ".tmp"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+        if sync:
+            # erst auf die Platte, dann umbenennen - sonst kann nach einem Absturz eine leere Datei übrig sein
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def write_json(path, obj, pretty=False):
+    write_atomic(path, encode_json(obj, pretty))
+
+def stat_stamp(st):
+    """Stand einer Datei als (st_mtime_ns, st_size) - die Summen-Datei gilt nur für genau diesen Stand"""
+    return st.st_mtime_ns, st.st_size
+
+def _stamped_blob(stamp, body):
+    """Inhalt eines Zwischenspeichers: Stand der Quelldatei und bereits kodiertes JSON"""
+    return b'{"source":%s,"data":%s}' % (encode_json(list(stamp)), body)
+
+def _read_stamped(path, stamp):
+    """Daten eines Zwischenspeichers, None wenn er fehlt, defekt ist oder zu einem anderen Stand gehört"""
+    try:
+        with open(path, 'rb') as f:
+            blob = decode_json(f.read())
+        if tuple(blob['source']) == stamp:
+            return blob['data']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+def _write_stamped(path, stamp, body):
+    try:
+        write_atomic(path, _stamped_blob(stamp, body))
+    except OSError:
+        pass  # nur Zwischenspeicher - beim nächsten Lesen wird das JSON verwendet
+
+def read_month_file(fname):
+    """Liest eine Monatsdatei"""
+    with open(fname, 'rb') as f:
+        return decode_json(f.read())
+
+def _agg_for(fname):
+    """Pfad der Summen-Datei (Einnahmen/Ausgaben) neben einer Monatsdatei"""
+    return os.path.splitext(fname)[0] + ".agg.json"
+
+def read_month_totals(fname, stamp):
+    """(Einnahmen, Ausgaben) aus der Summen-Datei, None wenn sie fehlt oder nicht genau zum Stand stamp der Monatsdatei gehört"""
+    data = _read_stamped(_agg_for(fname), stamp)
+    try:
+        return float(data['income']), float(data['expense'])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+def load_month_files(fname, need_payload=True):
+    """(stand, payload, summen) einer Monatsdatei - ohne Tk-Zugriff, damit es auch im Thread-Pool läuft"""
+    stamp = stat_stamp(os.stat(fname))
+    totals = None if need_payload else read_month_totals(fname, stamp)
+    payload = read_month_file(fname) if totals is None else None
+    return stamp, payload, totals
+
+def month_file_blobs(payload):
+    """Kodierte Inhalte einer Monatsdatei: JSON (maßgeblich) und Summen"""
+    incomes, expenses = month_totals([payload])
+    totals = {'income': float(incomes[0]), 'expense': float(expenses[0])}
+    return encode_json(payload, pretty=PRETTY_MONTH_FILES), encode_json(totals)
+
+def write_month_blobs(fname, blobs, sync=False):
+    """Schreibt die Monatsdatei und danach die Summen-Datei mit ihrem genauen Stand"""
+    data, totals = blobs
+    write_atomic(fname, data, sync)
+    _write_stamped(_agg_for(fname), stat_stamp(os.stat(fname)), totals)
+
+def write_month_file(fname, payload, sync=False):
+    """Schreibt eine Monatsdatei samt Summen-Datei"""
+    write_month_blobs(fname, month_file_blobs(payload), sync)
 
 def profile_folder(profile):
     return os.path.join(BASE_FOLDER, profile)
@@ -111,26 +350,92 @@ class BudgetApp:
         self.auto_fill_enabled = tk.BooleanVar(value=True)
         self.budget_warnings = {}
         
-        self.structure = DEFAULT_STRUCTURE.copy()
-        self.data = defaultdict(lambda: defaultdict(lambda: defaultdict(dict)))
+        self.structure = copy_structure(DEFAULT_STRUCTURE)
+        self._month_cache = OrderedDict()  # (profile, ym) -> [stand, payload, (einnahmen, ausgaben)]
+        self._present_cache = {}  # profile -> (ordner-mtime, {ym, ...})
+        self._io_pool = None  # Thread-Pool für paralleles Einlesen, bei Bedarf angelegt
 
         # UI-Variablen
         self.current_month = tk.StringVar(value=datetime.now().strftime("%Y-%m"))
         self.saving_note = tk.StringVar(value="")
         self.savings_goal = tk.StringVar(value="0")
         self.labels_by_item = {}
+        self.amounts = np.zeros(0)  # geparster Betrag je Posten, Index über _item_index
+        self._item_index = {}  # (mc, sc, item) -> Spalte in amounts
+        self._themed_widgets = []  # (widget, {option: farbrolle})
+        self._figures = []  # (figure, canvas, achsen_färben) der bereits aufgebauten Diagramm-Tabs
+
         self.totals_per_category = {}
+        self._limit_labels = {}
         self.delete_mode = tk.BooleanVar(value=False)
         self.current_profile = tk.StringVar(value=DEFAULT_PROFILE)
+        self._recalc_after_id = None
+        self._settings_after_id = None
+        self._scroll_after_id = None
+        self._ui_signature = None
+        self._charts_dirty = True
+        self._charts_key = None  # (profil, monat, anzahl monate) der letzten Diagramm-Aktualisierung
+        self._last_summary_key = None  # Eingangswerte der zuletzt angezeigten Zusatzinfos
+
+        # Hintergrund-Schreiber: je Pfad wird nur der zuletzt eingereihte Inhalt geschrieben
+        self._pending_writes = {}  # path -> (schreibfunktion, daten)
+        self._write_lock = threading.Lock()
+        self._write_queue = queue.Queue()
+        self._write_errors = queue.Queue()
+        threading.Thread(target=self._writer_loop, daemon=True).start()
 
         ensure_dir(profile_folder(DEFAULT_PROFILE))
         self.load_settings()
         
         self.apply_theme()
         self.build_ui()
-        self.load_month(self.current_month.get())
+        self.load_month(self.selected_month())
         self.recalculate_all()
 
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.root.after(WRITE_ERROR_POLL_MS, self._poll_write_errors)
+
+    def _enqueue_write(self, path, data, write=write_atomic):
+        """Reiht write(path, data) ein; ein noch offener Auftrag für denselben Pfad wird ersetzt"""
+        with self._write_lock:
+            is_new = path not in self._pending_writes
+            self._pending_writes[path] = (write, data)
+        if is_new:
+            self._write_queue.put(path)
+
+    def _writer_loop(self):
+        """Läuft im Hintergrund-Thread und schreibt eingereihte Dateien"""
+        while True:
+            path = self._write_queue.get()
+            try:
+                with self._write_lock:
+                    job = self._pending_writes.pop(path, None)
+                if job is not None:
+                    write, data = job
+                    write(path, data, sync=True)  # fsync kostet hier keine UI-Zeit
+            except Exception as e:
+                # jeder Fehler wird gemeldet - der Thread muss weiterlaufen, sonst hängt on_close im join()
+                self._write_errors.put((path, e))
+            finally:
+                self._write_queue.task_done()
+
+    def _poll_write_errors(self):
+        """Zeigt Fehler des Hintergrund-Schreibers im Tk-Thread an"""
+        while True:
+            try:
+                path, err = self._write_errors.get_nowait()
+            except queue.Empty:
+                break
+            messagebox.showerror("Fehler beim Speichern", f"{path}: {err}")
+        self.root.after(WRITE_ERROR_POLL_MS, self._poll_write_errors)
+
+    def on_close(self):
+        """Wartet auf ausstehende Schreibvorgänge und beendet die App"""
+        self.save_settings()  # noch vorgemerkte Einstellungen nicht verlieren
+        self._write_queue.join()
+        self._poll_write_errors()  # Fehler der letzten Schreibaufträge noch anzeigen
+        self.root.destroy()
+
     def apply_theme(self):
         """Wendet Dark/Light Theme an"""
         if self.dark_mode.get():
@@ -165,39 +470,54 @@ class BudgetApp:
         self.root.configure(bg=self.colors['bg'])
 
     def toggle_theme(self):
-        """Wechselt zwischen Dark und Light Mode - OHNE Datenverlust"""
+        """Wechselt zwischen Dark und Light Mode - färbt vorhandene Widgets um statt neu zu bauen"""
         self.dark_mode.set(not self.dark_mode.get())
-        self.save_settings()
+        self.schedule_settings_save()
         
-        # Speichere aktuellen Monat bevor UI neu aufgebaut wird
-        current_values = {}
-        for (mc, sc, item), refs in self.labels_by_item.items():
-            current_values[(mc, sc, item)] = {
-                "amt": refs["amt"].get(),
-                "note": refs["note"].get()
-            }
-        
-        # Theme anwenden und UI neu bauen
         self.apply_theme()
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        self.build_ui()
-        
-        # Daten wiederherstellen
-        for (mc, sc, item), refs in self.labels_by_item.items():
-            if (mc, sc, item) in current_values:
-                refs["amt"].set(current_values[(mc, sc, item)]["amt"])
-                refs["note"].set(current_values[(mc, sc, item)]["note"])
+        self.configure_styles()
+        for widget, roles in self._themed_widgets:
+            widget.configure(**{opt: self.colors[role] for opt, role in roles.items()})
+        self.theme_button.config(text="🌙" if self.dark_mode.get() else "☀️")
+        self._restyle_figures()
         
         self.recalculate_all()
 
+    def themed(self, widget, **roles):
+        """Färbt ein Widget nach Farbrollen (Option -> Schlüssel in self.colors) und merkt es für den Theme-Wechsel vor"""
+        widget.configure(**{opt: self.colors[role] for opt, role in roles.items()})
+        self._themed_widgets.append((widget, roles))
+        return widget
+
+    def _style_axes(self, ax):
+        """Färbt Achsenbeschriftung, Ticks und Rahmen in der Textfarbe des Themes"""
+        text_color = self.colors['fg']
+        ax.tick_params(colors=text_color)
+        ax.title.set_color(text_color)
+        ax.yaxis.label.set_color(text_color)
+        ax.xaxis.label.set_color(text_color)
+        for spine in ax.spines.values():
+            spine.set_color(text_color)
+
+    def _restyle_figures(self):
+        """Passt die bestehenden Diagramme an das Theme an, ohne sie neu aufzubauen"""
+        # die Tabs werden erst beim Öffnen aufgebaut - daher nur die Einträge in self._figures verwenden
+        for fig, canvas, style_axes in self._figures:
+            fig.set_facecolor(self.colors['bg'])
+            if style_axes:  # Tortendiagramm: Achsen bleiben unsichtbar
+                for ax in fig.axes:
+                    self._style_axes(ax)
+            canvas.draw_idle()
+
     def load_settings(self):
         """Lädt App-Einstellungen"""
         settings_path = os.path.join(BASE_FOLDER, SETTINGS_FILE)
+        # ohne Datei beim ersten Speichern anlegen
+        self._settings_dirty = not os.path.exists(settings_path)
         if os.path.exists(settings_path):
             try:
-                with open(settings_path, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
+                with open(settings_path, 'rb') as f:
+                    settings = decode_json(f.read())
                     self.dark_mode.set(settings.get('dark_mode', True))
                     self.auto_fill_enabled.set(settings.get('auto_fill', True))
                     self.budget_warnings = settings.get('budget_warnings', {})
@@ -206,8 +526,24 @@ class BudgetApp:
             except:
                 pass
 
+    def mark_settings_dirty(self):
+        """Merkt vor, dass save_settings wirklich schreiben muss"""
+        self._settings_dirty = True
+
+    def schedule_settings_save(self):
+        """Speichert Einstellungen im nächsten Idle-Zyklus - mehrere Änderungen hintereinander ergeben einen Schreibvorgang"""
+        self._settings_dirty = True
+        if self._settings_after_id is None:
+            self._settings_after_id = self.root.after_idle(self._flush_settings)
+
+    def _flush_settings(self):
+        self._settings_after_id = None
+        self.save_settings()
+
     def save_settings(self):
-        """Speichert App-Einstellungen"""
+        """Speichert App-Einstellungen - nur wenn sich seit dem letzten Speichern etwas geändert hat"""
+        if not self._settings_dirty:
+            return
         settings_path = os.path.join(BASE_FOLDER, SETTINGS_FILE)
         ensure_dir(BASE_FOLDER)
         settings = {
@@ -217,8 +553,8 @@ class BudgetApp:
             'structure': self.structure
         }
         try:
-            with open(settings_path, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            self._enqueue_write(settings_path, encode_json(settings, pretty=True))
+            self._settings_dirty = False
         except:
             pass
 
@@ -227,18 +563,18 @@ class BudgetApp:
     # ------------------------------
     def build_ui(self):
         # Topbar
-        top_frame = tk.Frame(self.root, bg=self.colors['bg_tertiary'], height=60)
+        top_frame = self.themed(tk.Frame(self.root, height=60), bg='bg_tertiary')
         top_frame.pack(fill="x", padx=0, pady=0)
         
         # Linke Seite: Monat
-        left_top = tk.Frame(top_frame, bg=self.colors['bg_tertiary'])
+        left_top = self.themed(tk.Frame(top_frame), bg='bg_tertiary')
         left_top.pack(side="left", padx=15, pady=10)
         
-        tk.Label(left_top, text="📅 Monat:", bg=self.colors['bg_tertiary'], 
-                fg=self.colors['fg_secondary'], font=("Segoe UI", 11, "bold")).pack(side="left", padx=(0,8))
-        month_entry = tk.Entry(left_top, textvariable=self.current_month, width=10, font=("Segoe UI", 11), 
-                              bg=self.colors['bg_input'], fg=self.colors['fg'], 
-                              insertbackground=self.colors['fg'], relief="flat", borderwidth=2)
+        self.themed(tk.Label(left_top, text="📅 Monat:", font=("Segoe UI", 11, "bold")),
+                   bg='bg_tertiary', fg='fg_secondary').pack(side="left", padx=(0,8))
+        month_entry = self.themed(tk.Entry(left_top, textvariable=self.current_month, width=10, font=("Segoe UI", 11), 
+                                          relief="flat", borderwidth=2),
+                                 bg='bg_input', fg='fg', insertbackground='fg')
         month_entry.pack(side="left", padx=5)
         
         # Navigation buttons
@@ -249,7 +585,7 @@ class BudgetApp:
         self.create_button(left_top, "💾 Speichern", self.on_save_click, self.colors['success']).pack(side="left", padx=3)
 
         # Mitte: Quick Actions
-        mid_top = tk.Frame(top_frame, bg=self.colors['bg_tertiary'])
+        mid_top = self.themed(tk.Frame(top_frame), bg='bg_tertiary')
         mid_top.pack(side="left", padx=20)
         
         self.create_button(mid_top, "🔄 Auto-Fill", self.auto_fill_fixed, "#5c2d91").pack(side="left", padx=3)
@@ -257,181 +593,187 @@ class BudgetApp:
         self.create_button(mid_top, "📥 CSV Import", self.import_bank_csv, "#ca5010").pack(side="left", padx=3)
 
         # Rechte Seite: Actions
-        right_top = tk.Frame(top_frame, bg=self.colors['bg_tertiary'])
+        right_top = self.themed(tk.Frame(top_frame), bg='bg_tertiary')
         right_top.pack(side="right", padx=15, pady=10)
         
         theme_icon = "🌙" if self.dark_mode.get() else "☀️"
-        self.create_button(right_top, theme_icon, self.toggle_theme, "#5c2d91", width=3).pack(side="left", padx=3)
+        self.theme_button = self.create_button(right_top, theme_icon, self.toggle_theme, "#5c2d91", width=3)
+        self.theme_button.pack(side="left", padx=3)
         
         self.create_button(right_top, "📄 PDF", self.export_pdf, "#ca5010").pack(side="left", padx=3)
         self.create_button(right_top, "📊 CSV", self.export_csv, "#107c10").pack(side="left", padx=3)
         
         # Löschmodus Toggle
-        delete_check = tk.Checkbutton(
+        delete_check = self.themed(tk.Checkbutton(
             right_top,
             text="🗑️ Löschmodus",
             variable=self.delete_mode,
-            bg=self.colors['bg_tertiary'],
-            fg=self.colors['danger'],
-            selectcolor=self.colors['bg_tertiary'],
-            activebackground=self.colors['bg_tertiary'],
-            activeforeground=self.colors['danger'],
             font=("Segoe UI", 10, "bold"),
             command=self.toggle_delete_mode
-        )
+        ), bg='bg_tertiary', fg='danger', selectcolor='bg_tertiary',
+           activebackground='bg_tertiary', activeforeground='danger')
         delete_check.pack(side="left", padx=8)
 
         # Main area mit Tabs
-        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame = self.themed(tk.Frame(self.root), bg='bg')
         main_frame.pack(fill="both", expand=True, padx=0, pady=0)
 
         # Notebook für Tabs
-        style = ttk.Style()
-        style.theme_use('default')
-        style.configure('TNotebook', background=self.colors['bg'], borderwidth=0)
-        style.configure('TNotebook.Tab', background=self.colors['bg_tertiary'], 
-                       foreground=self.colors['fg'], padding=[20, 10])
-        style.map('TNotebook.Tab', background=[('selected', self.colors['accent'])])
+        self.configure_styles()
         
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.pack(fill="both", expand=True, padx=10, pady=10)
 
         # Tab 1: Budget-Eingabe
-        self.budget_tab = tk.Frame(self.notebook, bg=self.colors['bg'])
+        self.budget_tab = self.themed(tk.Frame(self.notebook), bg='bg')
         self.notebook.add(self.budget_tab, text="💰 Budget-Eingabe")
         
         # Tab 2: Monatsvergleich
-        self.stats_tab = tk.Frame(self.notebook, bg=self.colors['bg'])
+        self.stats_tab = self.themed(tk.Frame(self.notebook), bg='bg')
         self.notebook.add(self.stats_tab, text="📊 Monatsvergleich")
         
         # Tab 3: Jahresübersicht
-        self.year_tab = tk.Frame(self.notebook, bg=self.colors['bg'])
+        self.year_tab = self.themed(tk.Frame(self.notebook), bg='bg')
         self.notebook.add(self.year_tab, text="📅 Jahresübersicht")
         
         # Tab 4: Trends & Prognosen
-        self.trends_tab = tk.Frame(self.notebook, bg=self.colors['bg'])
+        self.trends_tab = self.themed(tk.Frame(self.notebook), bg='bg')
         self.notebook.add(self.trends_tab, text="📈 Trends & Prognosen")
 
         self.build_budget_tab()
-        self.build_stats_tab()
-        self.build_year_tab()
-        self.build_trends_tab()
+        # Diagramm-Tabs erst beim ersten Öffnen aufbauen
+        self._tab_builders = {1: self.build_stats_tab, 2: self.build_year_tab, 3: self.build_trends_tab}
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event=None):
+        """Baut ein Tab beim ersten Auswählen auf"""
+        builder = self._tab_builders.pop(self.notebook.index("current"), None)
+        if builder is not None:
+            builder()
+
+    def configure_styles(self):
+        """Konfiguriert die ttk-Styles für das aktuelle Theme"""
+        style = ttk.Style()
+        style.theme_use('default')
+        style.configure('TNotebook', background=self.colors['bg'], borderwidth=0)
+        style.configure('TNotebook.Tab', background=self.colors['bg_tertiary'], 
+                       foreground=self.colors['fg'], padding=[20, 10])
+        style.map('TNotebook.Tab', background=[('selected', self.colors['accent'])])
 
     def build_budget_tab(self):
         """Erstellt das Budget-Eingabe Tab"""
         # Left side: Categories
-        left = tk.Frame(self.budget_tab, bg=self.colors['bg'])
+        left = self.themed(tk.Frame(self.budget_tab), bg='bg')
         left.pack(side="left", fill="both", expand=True, padx=10, pady=10)
 
         # Right side: Summary
-        right = tk.Frame(self.budget_tab, bg=self.colors['bg_secondary'])
+        right = self.themed(tk.Frame(self.budget_tab), bg='bg_secondary')
         right.pack(side="right", fill="y", padx=(0,10), pady=10)
 
         # Scrollable canvas
-        canvas = tk.Canvas(left, bg=self.colors['bg'], highlightthickness=0)
+        canvas = self.themed(tk.Canvas(left, highlightthickness=0), bg='bg')
         scrollbar = ttk.Scrollbar(left, orient="vertical", command=canvas.yview)
-        self.cat_frame = tk.Frame(canvas, bg=self.colors['bg'])
-        self.cat_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self.cat_canvas = canvas
+        self.cat_frame = self.themed(tk.Frame(canvas), bg='bg')
+        self.cat_frame.bind("<Configure>", lambda e: self._schedule_scroll_update())
         canvas.create_window((0,0), window=self.cat_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
 
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # Mausrad nur über der Kategorienliste: eigener Bindtag für Canvas und alle Zeilen-Widgets
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            canvas.bind_class(SCROLL_BINDTAG, seq, self._on_mousewheel)
+        self._add_scroll_tag(canvas)
 
         self.build_categories_ui()
 
         # Right panel: summary
-        right_inner = tk.Frame(right, bg=self.colors['bg_secondary'], width=340)
+        right_inner = self.themed(tk.Frame(right, width=340), bg='bg_secondary')
         right_inner.pack(fill="both", expand=True, padx=15, pady=15)
         right_inner.pack_propagate(False)
 
         # Header
-        header = tk.Frame(right_inner, bg=self.colors['bg_tertiary'], height=50)
+        header = self.themed(tk.Frame(right_inner, height=50), bg='bg_tertiary')
         header.pack(fill="x", pady=(0,15))
-        tk.Label(header, text="📊 Finanzübersicht", bg=self.colors['bg_tertiary'], 
-                fg=self.colors['fg'], font=("Segoe UI", 14, "bold")).pack(pady=12)
+        self.themed(tk.Label(header, text="📊 Finanzübersicht", font=("Segoe UI", 14, "bold")),
+                   bg='bg_tertiary', fg='fg').pack(pady=12)
 
         # Statistik Cards
-        self.create_stat_card(right_inner, "💰 Gesamteinnahmen", "0.00 €", self.colors['success'], "income_label")
-        self.create_stat_card(right_inner, "💸 Gesamtausgaben", "0.00 €", self.colors['danger'], "expense_label")
+        self.create_stat_card(right_inner, "💰 Gesamteinnahmen", "0.00 €", 'success', "income_label")
+        self.create_stat_card(right_inner, "💸 Gesamtausgaben", "0.00 €", 'danger', "expense_label")
         
         # Saldo Card
-        saldo_card = tk.Frame(right_inner, bg=self.colors['bg_tertiary'], relief="flat", borderwidth=0)
+        saldo_card = self.themed(tk.Frame(right_inner, relief="flat", borderwidth=0), bg='bg_tertiary')
         saldo_card.pack(fill="x", pady=8)
-        tk.Label(saldo_card, text="💵 Saldo", bg=self.colors['bg_tertiary'], 
-                fg=self.colors['fg_muted'], font=("Segoe UI", 10)).pack(anchor="w", padx=12, pady=(10,2))
-        self.balance_label = tk.Label(saldo_card, text="0.00 €", bg=self.colors['bg_tertiary'], 
-                                     fg=self.colors['fg'], font=("Segoe UI", 18, "bold"))
+        self.themed(tk.Label(saldo_card, text="💵 Saldo", font=("Segoe UI", 10)),
+                   bg='bg_tertiary', fg='fg_muted').pack(anchor="w", padx=12, pady=(10,2))
+        self.balance_label = self.themed(tk.Label(saldo_card, text="0.00 €", fg=self.colors['fg'], 
+                                                 font=("Segoe UI", 18, "bold")), bg='bg_tertiary')
         self.balance_label.pack(anchor="w", padx=12, pady=(0,10))
 
         # Sparziel
         ttk.Separator(right_inner, orient="horizontal").pack(fill="x", pady=15)
         
-        goal_frame = tk.Frame(right_inner, bg=self.colors['bg_secondary'])
+        goal_frame = self.themed(tk.Frame(right_inner), bg='bg_secondary')
         goal_frame.pack(fill="x", pady=5)
-        tk.Label(goal_frame, text="🎯 Monatliches Sparziel", bg=self.colors['bg_secondary'], 
-                fg=self.colors['fg_secondary'], font=("Segoe UI", 11, "bold")).pack(anchor="w", pady=(0,8))
+        self.themed(tk.Label(goal_frame, text="🎯 Monatliches Sparziel", font=("Segoe UI", 11, "bold")),
+                   bg='bg_secondary', fg='fg_secondary').pack(anchor="w", pady=(0,8))
         
-        goal_entry = tk.Entry(goal_frame, textvariable=self.savings_goal, font=("Segoe UI", 11),
-                            bg=self.colors['bg_input'], fg=self.colors['fg'], 
-                            insertbackground=self.colors['fg'], relief="flat", borderwidth=2)
+        goal_entry = self.themed(tk.Entry(goal_frame, textvariable=self.savings_goal, font=("Segoe UI", 11),
+                                         relief="flat", borderwidth=2),
+                                bg='bg_input', fg='fg', insertbackground='fg')
         goal_entry.pack(fill="x", pady=3)
-        goal_entry.bind("<KeyRelease>", lambda e: self.recalculate_all())
+        goal_entry.bind("<KeyRelease>", lambda e: self._schedule_recalc())
         
-        self.savings_progress = tk.Label(goal_frame, text="Fortschritt: 0 / 0 (0%)", 
-                                        bg=self.colors['bg_secondary'], fg=self.colors['fg_muted'], 
-                                        font=("Segoe UI", 9))
+        self.savings_progress = self.themed(tk.Label(goal_frame, text="Fortschritt: 0 / 0 (0%)", 
+                                                    font=("Segoe UI", 9)),
+                                           bg='bg_secondary', fg='fg_muted')
         self.savings_progress.pack(anchor="w", pady=5)
 
         # Top-3
         ttk.Separator(right_inner, orient="horizontal").pack(fill="x", pady=15)
-        tk.Label(right_inner, text="🔝 Top-3 Ausgaben", bg=self.colors['bg_secondary'], 
-                fg=self.colors['fg_secondary'], font=("Segoe UI", 11, "bold")).pack(anchor="w", pady=(0,10))
+        self.themed(tk.Label(right_inner, text="🔝 Top-3 Ausgaben", font=("Segoe UI", 11, "bold")),
+                   bg='bg_secondary', fg='fg_secondary').pack(anchor="w", pady=(0,10))
         
         self.top3_boxes = []
         for i in range(3):
-            box = tk.Frame(right_inner, bg=self.colors['bg_tertiary'], relief="flat")
+            box = self.themed(tk.Frame(right_inner, relief="flat"), bg='bg_tertiary')
             box.pack(fill="x", pady=3)
-            lbl = tk.Label(box, text=f"{i+1}. -", bg=self.colors['bg_tertiary'], 
-                          fg=self.colors['fg_secondary'], font=("Segoe UI", 9), anchor="w")
+            lbl = self.themed(tk.Label(box, text=f"{i+1}. -", font=("Segoe UI", 9), anchor="w"),
+                             bg='bg_tertiary', fg='fg_secondary')
             lbl.pack(padx=10, pady=6, fill="x")
             self.top3_boxes.append(lbl)
 
         # Zusatzinfos
         ttk.Separator(right_inner, orient="horizontal").pack(fill="x", pady=15)
         
-        info_frame = tk.Frame(right_inner, bg=self.colors['bg_secondary'])
+        info_frame = self.themed(tk.Frame(right_inner), bg='bg_secondary')
         info_frame.pack(fill="x")
         
-        self.saving_rate_label = tk.Label(info_frame, text="📈 Sparquote: 0.0 %", 
-                                         bg=self.colors['bg_secondary'], fg=self.colors['fg_secondary'], 
-                                         font=("Segoe UI", 9))
+        self.saving_rate_label = self.themed(tk.Label(info_frame, text="📈 Sparquote: 0.0 %", 
+                                                     font=("Segoe UI", 9)),
+                                            bg='bg_secondary', fg='fg_secondary')
         self.saving_rate_label.pack(anchor="w", pady=3)
         
-        self.fixed_var_label = tk.Label(info_frame, text="🔒 Fixkosten: 0.00 €", 
-                                       bg=self.colors['bg_secondary'], fg=self.colors['fg_secondary'], 
-                                       font=("Segoe UI", 9))
+        self.fixed_var_label = self.themed(tk.Label(info_frame, text="🔒 Fixkosten: 0.00 €", 
+                                                   font=("Segoe UI", 9)),
+                                          bg='bg_secondary', fg='fg_secondary')
         self.fixed_var_label.pack(anchor="w", pady=3)
         
-        self.variable_var_label = tk.Label(info_frame, text="🔄 Variable Kosten: 0.00 €", 
-                                          bg=self.colors['bg_secondary'], fg=self.colors['fg_secondary'], 
-                                          font=("Segoe UI", 9))
+        self.variable_var_label = self.themed(tk.Label(info_frame, text="🔄 Variable Kosten: 0.00 €", 
+                                                      font=("Segoe UI", 9)),
+                                             bg='bg_secondary', fg='fg_secondary')
         self.variable_var_label.pack(anchor="w", pady=3)
 
     def build_stats_tab(self):
         """Erstellt das Monatsvergleich-Tab"""
-        controls = tk.Frame(self.stats_tab, bg=self.colors['bg'])
+        controls = self.themed(tk.Frame(self.stats_tab), bg='bg')
         controls.pack(fill="x", padx=20, pady=10)
         
-        tk.Label(controls, text="Vergleichsmonate:", bg=self.colors['bg'], 
-                fg=self.colors['fg'], font=("Segoe UI", 11, "bold")).pack(side="left", padx=10)
+        self.themed(tk.Label(controls, text="Vergleichsmonate:", font=("Segoe UI", 11, "bold")),
+                   bg='bg', fg='fg').pack(side="left", padx=10)
         
         self.comparison_months = tk.StringVar(value="6")
         ttk.Spinbox(controls, from_=1, to=12, textvariable=self.comparison_months, 
@@ -441,40 +783,52 @@ class BudgetApp:
                           self.colors['accent']).pack(side="left", padx=10)
 
         # Charts container
-        charts_frame = tk.Frame(self.stats_tab, bg=self.colors['bg'])
+        charts_frame = self.themed(tk.Frame(self.stats_tab), bg='bg')
         charts_frame.pack(fill="both", expand=True, padx=20, pady=10)
 
         # Create matplotlib figures
         self.fig1 = Figure(figsize=(6, 4), facecolor=self.colors['bg'])
         self.fig2 = Figure(figsize=(6, 4), facecolor=self.colors['bg'])
+        # Achsen einmal anlegen und bei jeder Aktualisierung nur leeren
+        self.ax1 = self.fig1.add_subplot(111)
+        self.ax2 = self.fig2.add_subplot(111)
+        self._line_income, = self.ax1.plot([], [], marker='o', label='Einnahmen', color='#107c10', linewidth=2)
+        self._line_expense, = self.ax1.plot([], [], marker='s', label='Ausgaben', color='#d13438', linewidth=2)
+        self._line_balance, = self.ax1.plot([], [], marker='^', label='Saldo', color='#0078d4', linewidth=2)
+        self.ax1.set_ylabel('Betrag (€)')
+        self._legend1 = self.ax1.legend()
+        self._legend1.set_visible(False)
+        self.ax1.grid(True, alpha=0.3)
+        self._style_axes(self.ax1)
         
         # Chart 1: Monatlicher Verlauf
-        self.chart1_frame = tk.Frame(charts_frame, bg=self.colors['bg'])
+        self.chart1_frame = self.themed(tk.Frame(charts_frame), bg='bg')
         self.chart1_frame.pack(side="left", fill="both", expand=True, padx=5)
         
-        tk.Label(self.chart1_frame, text="📈 Monatlicher Verlauf", bg=self.colors['bg'], 
-                fg=self.colors['fg'], font=("Segoe UI", 12, "bold")).pack(pady=5)
+        self.themed(tk.Label(self.chart1_frame, text="📈 Monatlicher Verlauf", font=("Segoe UI", 12, "bold")),
+                   bg='bg', fg='fg').pack(pady=5)
         
         self.canvas1 = FigureCanvasTkAgg(self.fig1, self.chart1_frame)
         self.canvas1.get_tk_widget().pack(fill="both", expand=True)
         
         # Chart 2: Kategorien-Verteilung
-        self.chart2_frame = tk.Frame(charts_frame, bg=self.colors['bg'])
+        self.chart2_frame = self.themed(tk.Frame(charts_frame), bg='bg')
         self.chart2_frame.pack(side="right", fill="both", expand=True, padx=5)
         
-        tk.Label(self.chart2_frame, text="🥧 Ausgaben-Verteilung", bg=self.colors['bg'], 
-                fg=self.colors['fg'], font=("Segoe UI", 12, "bold")).pack(pady=5)
+        self.themed(tk.Label(self.chart2_frame, text="🥧 Ausgaben-Verteilung", font=("Segoe UI", 12, "bold")),
+                   bg='bg', fg='fg').pack(pady=5)
         
         self.canvas2 = FigureCanvasTkAgg(self.fig2, self.chart2_frame)
         self.canvas2.get_tk_widget().pack(fill="both", expand=True)
+        self._figures += [(self.fig1, self.canvas1, True), (self.fig2, self.canvas2, False)]
 
     def build_year_tab(self):
         """Erstellt das Jahresübersicht-Tab"""
-        controls = tk.Frame(self.year_tab, bg=self.colors['bg'])
+        controls = self.themed(tk.Frame(self.year_tab), bg='bg')
         controls.pack(fill="x", padx=20, pady=10)
         
-        tk.Label(controls, text="Jahr:", bg=self.colors['bg'], 
-                fg=self.colors['fg'], font=("Segoe UI", 11, "bold")).pack(side="left", padx=10)
+        self.themed(tk.Label(controls, text="Jahr:", font=("Segoe UI", 11, "bold")),
+                   bg='bg', fg='fg').pack(side="left", padx=10)
         
         self.year_select = tk.StringVar(value=str(datetime.now().year))
         ttk.Spinbox(controls, from_=2000, to=2100, textvariable=self.year_select, 
@@ -484,64 +838,66 @@ class BudgetApp:
                           self.colors['accent']).pack(side="left", padx=10)
 
         # Statistik-Bereich
-        stats_frame = tk.Frame(self.year_tab, bg=self.colors['bg_secondary'])
+        stats_frame = self.themed(tk.Frame(self.year_tab), bg='bg_secondary')
         stats_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
         # Summary Cards
-        summary = tk.Frame(stats_frame, bg=self.colors['bg_secondary'])
+        summary = self.themed(tk.Frame(stats_frame), bg='bg_secondary')
         summary.pack(fill="x", pady=10)
         
-        self.year_income_label = tk.Label(summary, text="Jahreseinnahmen: 0.00 €", 
-                                          bg=self.colors['bg_secondary'], fg=self.colors['success'],
-                                          font=("Segoe UI", 14, "bold"))
+        self.year_income_label = self.themed(tk.Label(summary, text="Jahreseinnahmen: 0.00 €", 
+                                                     font=("Segoe UI", 14, "bold")),
+                                            bg='bg_secondary', fg='success')
         self.year_income_label.pack(pady=5)
         
-        self.year_expense_label = tk.Label(summary, text="Jahresausgaben: 0.00 €", 
-                                           bg=self.colors['bg_secondary'], fg=self.colors['danger'],
-                                           font=("Segoe UI", 14, "bold"))
+        self.year_expense_label = self.themed(tk.Label(summary, text="Jahresausgaben: 0.00 €", 
+                                                      font=("Segoe UI", 14, "bold")),
+                                             bg='bg_secondary', fg='danger')
         self.year_expense_label.pack(pady=5)
         
-        self.year_balance_label = tk.Label(summary, text="Jahressaldo: 0.00 €", 
-                                           bg=self.colors['bg_secondary'], fg=self.colors['accent'],
-                                           font=("Segoe UI", 16, "bold"))
+        self.year_balance_label = self.themed(tk.Label(summary, text="Jahressaldo: 0.00 €", 
+                                                      fg=self.colors['accent'], font=("Segoe UI", 16, "bold")),
+                                             bg='bg_secondary')
         self.year_balance_label.pack(pady=10)
         
         # Durchschnittswerte
         ttk.Separator(stats_frame).pack(fill="x", pady=10)
         
-        avg_frame = tk.Frame(stats_frame, bg=self.colors['bg_secondary'])
+        avg_frame = self.themed(tk.Frame(stats_frame), bg='bg_secondary')
         avg_frame.pack(fill="x", pady=10)
         
-        tk.Label(avg_frame, text="📊 Durchschnittswerte (Monat)", bg=self.colors['bg_secondary'],
-                fg=self.colors['fg'], font=("Segoe UI", 12, "bold")).pack(pady=5)
+        self.themed(tk.Label(avg_frame, text="📊 Durchschnittswerte (Monat)", font=("Segoe UI", 12, "bold")),
+                   bg='bg_secondary', fg='fg').pack(pady=5)
         
-        self.avg_income_label = tk.Label(avg_frame, text="Ø Einnahmen: 0.00 €", 
-                                         bg=self.colors['bg_secondary'], fg=self.colors['fg_secondary'],
-                                         font=("Segoe UI", 11))
+        self.avg_income_label = self.themed(tk.Label(avg_frame, text="Ø Einnahmen: 0.00 €", 
+                                                    font=("Segoe UI", 11)),
+                                           bg='bg_secondary', fg='fg_secondary')
         self.avg_income_label.pack(pady=3)
         
-        self.avg_expense_label = tk.Label(avg_frame, text="Ø Ausgaben: 0.00 €", 
-                                          bg=self.colors['bg_secondary'], fg=self.colors['fg_secondary'],
-                                          font=("Segoe UI", 11))
+        self.avg_expense_label = self.themed(tk.Label(avg_frame, text="Ø Ausgaben: 0.00 €", 
+                                                     font=("Segoe UI", 11)),
+                                            bg='bg_secondary', fg='fg_secondary')
         self.avg_expense_label.pack(pady=3)
         
-        self.avg_balance_label = tk.Label(avg_frame, text="Ø Saldo: 0.00 €", 
-                                          bg=self.colors['bg_secondary'], fg=self.colors['fg_secondary'],
-                                          font=("Segoe UI", 11))
+        self.avg_balance_label = self.themed(tk.Label(avg_frame, text="Ø Saldo: 0.00 €", 
+                                                     font=("Segoe UI", 11)),
+                                            bg='bg_secondary', fg='fg_secondary')
         self.avg_balance_label.pack(pady=3)
         
         # Chart
         self.fig_year = Figure(figsize=(10, 5), facecolor=self.colors['bg'])
         self.canvas_year = FigureCanvasTkAgg(self.fig_year, stats_frame)
+        self.ax_year = self.fig_year.add_subplot(111)
         self.canvas_year.get_tk_widget().pack(fill="both", expand=True, pady=10)
+        self._figures.append((self.fig_year, self.canvas_year, True))
 
     def build_trends_tab(self):
         """Erstellt das Trends & Prognosen-Tab"""
-        controls = tk.Frame(self.trends_tab, bg=self.colors['bg'])
+        controls = self.themed(tk.Frame(self.trends_tab), bg='bg')
         controls.pack(fill="x", padx=20, pady=10)
         
-        tk.Label(controls, text="🔮 Prognose für nächste Monate:", bg=self.colors['bg'], 
-                fg=self.colors['fg'], font=("Segoe UI", 11, "bold")).pack(side="left", padx=10)
+        self.themed(tk.Label(controls, text="🔮 Prognose für nächste Monate:", font=("Segoe UI", 11, "bold")),
+                   bg='bg', fg='fg').pack(side="left", padx=10)
         
         self.forecast_months = tk.StringVar(value="3")
         ttk.Spinbox(controls, from_=1, to=6, textvariable=self.forecast_months, 
@@ -551,16 +907,18 @@ class BudgetApp:
                           self.colors['accent']).pack(side="left", padx=10)
 
         # Info-Text
-        info = tk.Label(self.trends_tab, 
-                       text="Basierend auf den letzten 6 Monaten wird ein Trend berechnet.",
-                       bg=self.colors['bg'], fg=self.colors['fg_muted'], 
-                       font=("Segoe UI", 9, "italic"))
+        info = self.themed(tk.Label(self.trends_tab, 
+                                   text="Basierend auf den letzten 6 Monaten wird ein Trend berechnet.",
+                                   font=("Segoe UI", 9, "italic")),
+                          bg='bg', fg='fg_muted')
         info.pack(pady=5)
 
         # Charts
         self.fig_trend = Figure(figsize=(12, 6), facecolor=self.colors['bg'])
         self.canvas_trend = FigureCanvasTkAgg(self.fig_trend, self.trends_tab)
+        self.ax_trend = self.fig_trend.add_subplot(111)
         self.canvas_trend.get_tk_widget().pack(fill="both", expand=True, padx=20, pady=10)
+        self._figures.append((self.fig_trend, self.canvas_trend, True))
 
     def create_button(self, parent, text, command, color, width=None):
         """Erstellt einen styled Button"""
@@ -570,8 +928,9 @@ class BudgetApp:
         if width:
             btn.config(width=width)
         
+        hover = lighten_color(color)  # einmal pro Button statt bei jedem <Enter>
         def on_enter(e):
-            btn.config(bg=self.lighten_color(color))
+            btn.config(bg=hover)
         def on_leave(e):
             btn.config(bg=color)
         
@@ -579,31 +938,27 @@ class BudgetApp:
         btn.bind("<Leave>", on_leave)
         return btn
 
-    def lighten_color(self, color):
-        """Hellt eine Farbe auf"""
-        color = color.lstrip('#')
-        r, g, b = tuple(int(color[i:i+2], 16) for i in (0, 2, 4))
-        r = min(255, r + 20)
-        g = min(255, g + 20)
-        b = min(255, b + 20)
-        return f'#{r:02x}{g:02x}{b:02x}'
-
-    def create_stat_card(self, parent, title, value, color, var_name):
+    def create_stat_card(self, parent, title, value, color_role, var_name):
         """Erstellt eine Statistik-Karte"""
-        card = tk.Frame(parent, bg=self.colors['bg_tertiary'], relief="flat", borderwidth=0)
+        card = self.themed(tk.Frame(parent, relief="flat", borderwidth=0), bg='bg_tertiary')
         card.pack(fill="x", pady=5)
         
-        tk.Label(card, text=title, bg=self.colors['bg_tertiary'], fg=self.colors['fg_muted'], 
-                font=("Segoe UI", 9)).pack(anchor="w", padx=12, pady=(8,2))
+        self.themed(tk.Label(card, text=title, font=("Segoe UI", 9)),
+                   bg='bg_tertiary', fg='fg_muted').pack(anchor="w", padx=12, pady=(8,2))
         
-        lbl = tk.Label(card, text=value, bg=self.colors['bg_tertiary'], fg=color, 
-                      font=("Segoe UI", 14, "bold"))
+        lbl = self.themed(tk.Label(card, text=value, font=("Segoe UI", 14, "bold")),
+                         bg='bg_tertiary', fg=color_role)
         lbl.pack(anchor="w", padx=12, pady=(0,8))
         
         setattr(self, var_name, lbl)
 
     def build_categories_ui(self):
-        """Erstellt die Kategorien-UI"""
+        """Erstellt die Kategorien-UI (nur neu, wenn sich die Struktur geändert hat)"""
+        signature = encode_json(self.structure, sort_keys=True)
+        if signature == self._ui_signature and self.labels_by_item:
+            return
+        self._ui_signature = signature
+
         # Speichere aktuelle Werte
         current_values = {}
         for (mc, sc, item), refs in self.labels_by_item.items():
@@ -614,23 +969,32 @@ class BudgetApp:
         
         for w in self.cat_frame.winfo_children():
             w.destroy()
+        self._themed_widgets = [(w, roles) for w, roles in self._themed_widgets if w.winfo_exists()]
         self.labels_by_item.clear()
+        self._item_index = {}
         self.totals_per_category.clear()
+        self._total_labels = []  # parallel zu self._main_names
+        self._limit_labels.clear()
+        # Gruppen-IDs je Posten für die Summen in recalculate_all
+        amounts, kinds, mains, subs_of_item = [], [], [], []
+        self._main_names = list(self.structure.keys())
+        self._mc_kind = {mc: category_kind(mc) for mc in self._main_names}
+        self._sub_names, self._sub_is_expense = [], []
 
         row = 0
         for main_cat, subs in self.structure.items():
-            mc_frame = tk.LabelFrame(self.cat_frame, text="", bg=self.colors['bg_secondary'], 
-                                    fg=self.colors['fg'], relief="flat", borderwidth=2, padx=12, pady=10)
+            mc_frame = self.themed(tk.LabelFrame(self.cat_frame, text="", relief="flat", borderwidth=2, padx=12, pady=10),
+                                  bg='bg_secondary', fg='fg')
             mc_frame.grid(row=row, column=0, sticky="we", padx=8, pady=8)
             mc_frame.columnconfigure(2, weight=1)
             
-            header_frame = tk.Frame(mc_frame, bg=self.colors['bg_secondary'])
+            header_frame = self.themed(tk.Frame(mc_frame), bg='bg_secondary')
             header_frame.grid(row=0, column=0, columnspan=4, sticky="we", pady=(0,8))
             
-            icon = "💰" if "Einnahmen" in main_cat else "🏠" if "Fix" in main_cat else "🛒" if "Variable" in main_cat else "🎯"
+            icon = category_icon(main_cat)
             
-            tk.Label(header_frame, text=f"{icon} {main_cat}", bg=self.colors['bg_secondary'], 
-                    fg=self.colors['fg'], font=("Segoe UI", 12, "bold")).pack(side="left")
+            self.themed(tk.Label(header_frame, text=f"{icon} {main_cat}", font=("Segoe UI", 12, "bold")),
+                       bg='bg_secondary', fg='fg').pack(side="left")
             
             add_sub_btn = tk.Button(header_frame, text="➕ Unterkat.", 
                                    command=lambda mc=main_cat: self.quick_add_subcategory(mc),
@@ -638,24 +1002,25 @@ class BudgetApp:
                                    relief="flat", cursor="hand2", padx=8, pady=3)
             add_sub_btn.pack(side="left", padx=10)
             
-            budget_limit = self.budget_warnings.get(main_cat)
-            if budget_limit:
-                tk.Label(header_frame, text=f"⚠️ Limit: {budget_limit} €", 
-                        bg=self.colors['bg_secondary'], fg=self.colors['warning'],
-                        font=("Segoe UI", 9)).pack(side="left", padx=10)
-            
-            total_label = tk.Label(header_frame, text="Summe: 0.00 €", bg=self.colors['bg_secondary'], 
-                                 fg=self.colors['warning'], font=("Segoe UI", 11, "bold"))
+            total_label = self.themed(tk.Label(header_frame, text="Summe: 0.00 €", fg=self.colors['warning'],
+                                              font=("Segoe UI", 11, "bold")), bg='bg_secondary')
             total_label.pack(side="right")
             self.totals_per_category[main_cat] = total_label
+            self._total_labels.append(total_label)
+            # Limit-Label existiert immer, wird aber nur bei gesetztem Limit angezeigt
+            self._limit_labels[main_cat] = self.themed(tk.Label(header_frame, text="", font=("Segoe UI", 9)),
+                                                       bg='bg_secondary', fg='warning')
 
+            main_id = self._main_names.index(main_cat)
+            kind = self._mc_kind[main_cat]
             subrow = 1
             for subcat, items in subs.items():
-                sc_frame = tk.Frame(mc_frame, bg=self.colors['bg_tertiary'])
+                sub_id = None
+                sc_frame = self.themed(tk.Frame(mc_frame), bg='bg_tertiary')
                 sc_frame.grid(row=subrow, column=0, columnspan=4, sticky="we", pady=(8,4))
                 
-                tk.Label(sc_frame, text=f"📁 {subcat}", bg=self.colors['bg_tertiary'], 
-                        fg=self.colors['fg_secondary'], font=("Segoe UI", 10, "bold")).pack(side="left", padx=8, pady=4)
+                self.themed(tk.Label(sc_frame, text=f"📁 {subcat}", font=("Segoe UI", 10, "bold")),
+                           bg='bg_tertiary', fg='fg_secondary').pack(side="left", padx=8, pady=4)
                 
                 add_item_btn = tk.Button(sc_frame, text="➕", 
                                         command=lambda mc=main_cat, sc=subcat: self.quick_add_item(mc, sc),
@@ -666,71 +1031,136 @@ class BudgetApp:
                 subrow += 1
 
                 for item in items:
-                    item_frame = tk.Frame(mc_frame, bg=self.colors['bg_secondary'])
-                    item_frame.grid(row=subrow, column=0, columnspan=4, sticky="we", pady=2)
-                    item_frame.columnconfigure(2, weight=1)
-                    
-                    name_label = tk.Label(item_frame, text=f"  • {item}", bg=self.colors['bg_secondary'], 
-                                        fg=self.colors['fg'], font=("Segoe UI", 10), anchor="w", width=20)
-                    name_label.grid(row=0, column=0, sticky="w", padx=(12,8))
+                    # Zellen liegen direkt im Raster der Hauptkategorie - kein eigener Frame pro Posten
+                    name_label = self.themed(tk.Label(mc_frame, text=f"  • {item}", font=("Segoe UI", 10),
+                                                     anchor="w", width=20),
+                                            bg='bg_secondary', fg='fg')
+                    name_label.grid(row=subrow, column=0, sticky="w", padx=(12,8), pady=2)
 
                     amt_var = tk.StringVar(value="0")
-                    amt_entry = tk.Entry(item_frame, textvariable=amt_var, width=12, 
-                                       font=("Segoe UI", 10), bg=self.colors['bg_input'], 
-                                       fg=self.colors['fg'], insertbackground=self.colors['fg'], 
-                                       relief="flat", justify="right")
-                    amt_entry.grid(row=0, column=1, sticky="w", padx=5)
+                    amt_entry = self.themed(tk.Entry(mc_frame, textvariable=amt_var, width=12, 
+                                                    font=("Segoe UI", 10), relief="flat", justify="right"),
+                                           bg='bg_input', fg='fg', insertbackground='fg')
+                    amt_entry.grid(row=subrow, column=1, sticky="w", padx=5, pady=2)
                     
                     note_var = tk.StringVar(value="")
-                    note_entry = tk.Entry(item_frame, textvariable=note_var, width=25,
-                                        font=("Segoe UI", 9), bg=self.colors['bg_input'], 
-                                        fg=self.colors['fg_muted'], insertbackground=self.colors['fg'], 
-                                        relief="flat")
-                    note_entry.grid(row=0, column=2, sticky="we", padx=5)
-                    
-                    if self.delete_mode.get():
-                        del_btn = tk.Button(item_frame, text="❌", 
-                                          command=lambda m=main_cat, s=subcat, i=item: self.delete_item(m, s, i),
-                                          bg=self.colors['danger'], fg="white", font=("Segoe UI", 8, "bold"),
-                                          relief="flat", cursor="hand2", width=3)
-                        del_btn.grid(row=0, column=3, padx=5)
+                    note_entry = self.themed(tk.Entry(mc_frame, textvariable=note_var, width=25,
+                                                     font=("Segoe UI", 9), relief="flat"),
+                                            bg='bg_input', fg='fg_muted', insertbackground='fg')
+                    note_entry.grid(row=subrow, column=2, sticky="we", padx=5, pady=2)
 
                     key = (main_cat, subcat, item)
-                    self.labels_by_item[key] = {"amt": amt_var, "note": note_var}
+                    # Löschbutton erst beim ersten Einschalten des Löschmodus erstellen
+                    self.labels_by_item[key] = {"amt": amt_var, "note": note_var, "del_btn": None,
+                                                "cell": (mc_frame, subrow),
+                                                "widgets": (name_label, amt_entry, note_entry)}
+                    if self.delete_mode.get():
+                        self._show_delete_button(key)
                     
                     if key in current_values:
                         amt_var.set(current_values[key]["amt"])
                         note_var.set(current_values[key]["note"])
+                    if key not in self._item_index:
+                        if sub_id is None:
+                            sub_id = len(self._sub_names)
+                            self._sub_names.append(f"{main_cat} / {subcat}")
+                            self._sub_is_expense.append(kind != KIND_INCOME)
+                        self._item_index[key] = len(amounts)
+                        amounts.append(ensure_float(amt_var.get()))
+                        kinds.append(kind)
+                        mains.append(main_id)
+                        subs_of_item.append(sub_id)
                     
-                    amt_var.trace_add("write", lambda *_args, k=key: self.on_amount_change(k))
+                    # Neuberechnung erst wenn die Eingabe abgeschlossen ist, nicht pro Tastendruck
+                    amt_entry._budget_key = key
+                    amt_entry.bind("<FocusOut>", self._on_amt_commit)
+                    amt_entry.bind("<Return>", self._on_amt_commit)
 
                     subrow += 1
 
             row += 1
 
+        self.refresh_category_labels()
+        self._add_scroll_tag(self.cat_frame)
+        self._schedule_scroll_update()
+
+        self.amounts = np.array(amounts, dtype=np.float64)
+        self._item_kind = np.array(kinds, dtype=np.intp)
+        self._item_main = np.array(mains, dtype=np.intp)
+        self._item_sub = np.array(subs_of_item, dtype=np.intp)
+        self._expense_subs = np.flatnonzero(self._sub_is_expense)
+
+    def refresh_category_labels(self):
+        """Aktualisiert die Limit-Anzeigen, ohne die Kategorien-UI neu aufzubauen"""
+        for mc, lbl in self._limit_labels.items():
+            budget_limit = self.budget_warnings.get(mc)
+            if budget_limit:
+                lbl.configure(text=f"⚠️ Limit: {budget_limit} €")
+                if not lbl.winfo_manager():
+                    lbl.pack(side="left", padx=10, before=self.totals_per_category[mc])
+            elif lbl.winfo_manager():
+                lbl.pack_forget()
+
+    def _schedule_scroll_update(self):
+        """Aktualisiert die Scrollregion einmal pro Idle-Zyklus statt bei jedem <Configure>"""
+        if self._scroll_after_id is None:
+            self._scroll_after_id = self.root.after_idle(self._update_scroll_region)
+
+    def _update_scroll_region(self):
+        self._scroll_after_id = None
+        self.cat_canvas.configure(scrollregion=self.cat_canvas.bbox("all"))
+
+    def _add_scroll_tag(self, widget):
+        """Hängt den Scroll-Bindtag an ein Widget und alle Kinder"""
+        tags = widget.bindtags()
+        if SCROLL_BINDTAG not in tags:
+            widget.bindtags((SCROLL_BINDTAG,) + tuple(tags))
+        for child in widget.winfo_children():
+            self._add_scroll_tag(child)
+
+    def _on_mousewheel(self, event):
+        """Scrollt die Kategorienliste (Button-4/5 unter X11)"""
+        if event.num == 4:
+            step = -1
+        elif event.num == 5:
+            step = 1
+        else:
+            step = int(-1*(event.delta/120))
+        self.cat_canvas.yview_scroll(step, "units")
+
     def toggle_delete_mode(self):
-        """Schaltet Löschmodus um"""
-        self.build_categories_ui()
+        """Schaltet Löschmodus um - blendet nur die Löschbuttons ein/aus"""
+        show = self.delete_mode.get()
+        for key, refs in self.labels_by_item.items():
+            if show:
+                self._show_delete_button(key)
+            elif refs["del_btn"] is not None:
+                refs["del_btn"].grid_remove()
+
+    def _show_delete_button(self, key):
+        """Blendet den Löschbutton eines Postens ein und erstellt ihn beim ersten Mal"""
+        refs = self.labels_by_item[key]
+        parent, row = refs["cell"]
+        if refs["del_btn"] is None:
+            m, s, i = key
+            refs["del_btn"] = tk.Button(parent, text="❌", command=lambda: self.delete_item(m, s, i),
+                                        bg=self.colors['danger'], fg="white", font=("Segoe UI", 8, "bold"),
+                                        relief="flat", cursor="hand2", width=3)
+            self._add_scroll_tag(refs["del_btn"])
+        refs["del_btn"].grid(row=row, column=3, padx=5, pady=2)
+
+    def selected_month(self):
+        """Monat aus dem Eingabefeld - alle Leser gehen hierüber, damit Leerzeichen nie stören"""
+        return month_key_from_selection(self.current_month.get())
 
     def navigate_month(self, direction):
         """Navigiert zum vorherigen/nächsten Monat"""
-        try:
-            current = self.current_month.get()
-            year, month = map(int, current.split('-'))
-            
-            month += direction
-            if month > 12:
-                month = 1
-                year += 1
-            elif month < 1:
-                month = 12
-                year -= 1
-            
-            new_month = f"{year}-{month:02d}"
-            self.current_month.set(new_month)
-            self.load_month(new_month)
-        except:
+        new_month = shift_month(self.selected_month(), direction)
+        if not new_month:
             messagebox.showerror("Fehler", "Ungültiges Monatsformat")
+            return
+        self.current_month.set(new_month)
+        self.load_month(new_month)
 
     def quick_add_subcategory(self, main_cat):
         """Schnelles Hinzufügen einer Unterkategorie"""
@@ -740,7 +1170,7 @@ class BudgetApp:
         if subcat and subcat.strip():
             if subcat not in self.structure[main_cat]:
                 self.structure[main_cat][subcat] = []
-                self.save_settings()
+                self.schedule_settings_save()
                 self.build_categories_ui()
                 messagebox.showinfo("✅ Erfolg", f"Unterkategorie '{subcat}' hinzugefügt!")
             else:
@@ -754,7 +1184,7 @@ class BudgetApp:
         if item and item.strip():
             if item not in self.structure[main_cat][subcat]:
                 self.structure[main_cat][subcat].append(item)
-                self.save_settings()
+                self.schedule_settings_save()
                 self.build_categories_ui()
                 messagebox.showinfo("✅ Erfolg", f"Posten '{item}' hinzugefügt!")
                 self.recalculate_all()
@@ -775,41 +1205,60 @@ class BudgetApp:
         if not self.structure[main_cat]:
             del self.structure[main_cat]
 
-        self.save_settings()
-        self.build_categories_ui()
+        self.schedule_settings_save()
+        key = (main_cat, subcat, item)
+        if subcat in self.structure.get(main_cat, {}) and key in self.labels_by_item:
+            self._remove_item_row(key)
+        else:
+            # Unter- oder Hauptkategorie ist weggefallen: Aufbau komplett neu
+            self.build_categories_ui()
         self.recalculate_all()
 
+    def _remove_item_row(self, key):
+        """Entfernt die Zeile eines Postens, ohne die übrige Kategorien-UI neu aufzubauen"""
+        refs = self.labels_by_item.pop(key)
+        for w in refs["widgets"] + ((refs["del_btn"],) if refs["del_btn"] is not None else ()):
+            w.destroy()
+        self._themed_widgets = [(w, roles) for w, roles in self._themed_widgets if w.winfo_exists()]
+
+        # Posten aus den parallelen Arrays streichen und die Indizes dahinter nachrücken
+        idx = self._item_index.pop(key)
+        self.amounts = np.delete(self.amounts, idx)
+        self._item_kind = np.delete(self._item_kind, idx)
+        self._item_main = np.delete(self._item_main, idx)
+        self._item_sub = np.delete(self._item_sub, idx)
+        for k, i in self._item_index.items():
+            if i > idx:
+                self._item_index[k] = i - 1
+        self._ui_signature = encode_json(self.structure, sort_keys=True)
+
     def auto_fill_fixed(self):
         """Auto-Fill für Fixkosten vom letzten Monat"""
         if not self.auto_fill_enabled.get():
             messagebox.showinfo("Info", "Auto-Fill ist deaktiviert.")
             return
         
-        current_month = self.current_month.get()
+        current_month = self.selected_month()
         prev_month = get_previous_month(current_month)
         
         if not prev_month:
             messagebox.showerror("Fehler", "Vorheriger Monat konnte nicht ermittelt werden")
             return
         
-        prev_file = filename_for_month(self.current_profile.get(), prev_month)
-        
-        if not os.path.exists(prev_file):
-            messagebox.showinfo("Info", f"Keine Daten für {prev_month} gefunden")
-            return
-        
         try:
-            with open(prev_file, 'r', encoding='utf-8') as f:
-                prev_data = json.load(f)
+            prev_data = self.read_month(prev_month)
+            if prev_data is None:
+                messagebox.showinfo("Info", f"Keine Daten für {prev_month} gefunden")
+                return
             
             prev_values = prev_data.get('values', {})
             filled_count = 0
             
             for (mc, sc, item), refs in self.labels_by_item.items():
-                if "Fix" in mc or mc.lower().startswith("fix"):
+                if self._mc_kind.get(mc) == KIND_FIXED:
                     prev_val = prev_values.get(mc, {}).get(sc, {}).get(item, {})
                     if prev_val.get('amount'):
-                        refs['amt'].set(prev_val['amount'])
+                        self.set_amount((mc, sc, item), prev_val['amount'])
                         refs['note'].set(prev_val.get('note', ''))
                         filled_count += 1
             
@@ -859,8 +1308,9 @@ class BudgetApp:
                 elif cat in self.budget_warnings:
                     del self.budget_warnings[cat]
             
-            self.save_settings()
-            self.build_categories_ui()
+            self.schedule_settings_save()
+            self.refresh_category_labels()
+            self.recalculate_all()
             dialog.destroy()
             messagebox.showinfo("✅", "Budget-Limits gespeichert!")
         
@@ -886,24 +1336,17 @@ class BudgetApp:
         tk.Label(dialog, text="📥 CSV Import - Spalten zuordnen", bg=self.colors['bg'], 
                 fg=self.colors['fg'], font=("Segoe UI", 12, "bold")).pack(pady=15)
         
-        # CSV lesen
+        # CSV einmal lesen - der Import verwendet denselben Text (und dieselbe Kodierung)
         try:
-            with open(file, 'r', encoding='utf-8-sig') as f:
-                reader = csv.reader(f, delimiter=';')
-                headers = next(reader)
-                sample_rows = [next(reader, None) for _ in range(3)]
-                sample_rows = [r for r in sample_rows if r]
-        except:
-            try:
-                with open(file, 'r', encoding='latin-1') as f:
-                    reader = csv.reader(f, delimiter=';')
-                    headers = next(reader)
-                    sample_rows = [next(reader, None) for _ in range(3)]
-                    sample_rows = [r for r in sample_rows if r]
-            except Exception as e:
-                messagebox.showerror("Fehler", f"CSV konnte nicht gelesen werden: {str(e)}")
-                dialog.destroy()
-                return
+            text = read_csv_text(file)
+            reader = csv.reader(io.StringIO(text), delimiter=';')
+            headers = next(reader)
+            sample_rows = [next(reader, None) for _ in range(3)]
+            sample_rows = [r for r in sample_rows if r]
+        except Exception as e:
+            messagebox.showerror("Fehler", f"CSV konnte nicht gelesen werden: {str(e)}")
+            dialog.destroy()
+            return
         
         frame = tk.Frame(dialog, bg=self.colors['bg'])
         frame.pack(fill="both", expand=True, padx=20, pady=10)
@@ -938,25 +1381,12 @@ class BudgetApp:
                 amount_idx = headers.index(amount_col)
                 desc_idx = headers.index(desc_col)
                 
-                # CSV nochmal einlesen
-                with open(file, 'r', encoding='utf-8-sig') as f:
-                    reader = csv.reader(f, delimiter=';')
-                    next(reader)  # Skip header
-                    
-                    imported = 0
-                    for row in reader:
-                        if len(row) <= max(amount_idx, desc_idx):
-                            continue
-                        
-                        amount_str = row[amount_idx].replace('.', '').replace(',', '.')
-                        amount = ensure_float(amount_str)
-                        desc = row[desc_idx]
-                        
-                        if amount != 0:
-                            # Hier könntest du intelligentes Mapping implementieren
-                            # Für jetzt: Zeige Dialog zum manuellen Zuordnen
-                            pass
-                            imported += 1
+                reader = csv.reader(io.StringIO(text), delimiter=';')
+                next(reader)  # Skip header
+                amounts = bank_amounts(reader, amount_idx, max(amount_idx, desc_idx) + 1)
+                # Hier könntest du intelligentes Mapping implementieren
+                # Für jetzt: nur Buchungen mit Betrag zählen
+                imported = int(np.count_nonzero(amounts))
                 
                 dialog.destroy()
                 messagebox.showinfo("✅ Import", f"{imported} Transaktionen erkannt.\n(Manuelle Zuordnung noch nicht implementiert)")
@@ -969,95 +1399,47 @@ class BudgetApp:
                  padx=20, pady=8).pack(pady=15)
 
     def update_charts(self):
-        """Aktualisiert Monatsvergleich-Charts"""
+        """Aktualisiert Monatsvergleich-Charts - überspringt das Neuzeichnen, wenn sich nichts geändert hat"""
         try:
             num_months = int(self.comparison_months.get())
         except:
             num_months = 6
         
-        months_data = []
-        current = self.current_month.get()
-        
-        for i in range(num_months):
-            month = current
-            for _ in range(i):
-                month = get_previous_month(month)
-                if not month:
-                    break
-            
-            if not month:
-                break
-            
-            fname = filename_for_month(self.current_profile.get(), month)
-            if os.path.exists(fname):
-                try:
-                    with open(fname, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    months_data.append((month, data))
-                except:
-                    pass
+        charts_key = (self.current_profile.get(), self.selected_month(), num_months)
+        if not self._charts_dirty and charts_key == self._charts_key:
+            return
         
+        months_data = self.month_summaries(previous_months(self.selected_month(), num_months))
         months_data.reverse()
         
-        # Chart 1: Verlauf
-        self.fig1.clear()
-        ax1 = self.fig1.add_subplot(111)
-        
-        if months_data:
-            labels = [m[0] for m in months_data]
-            incomes = []
-            expenses = []
-            balances = []
-            
-            for month, data in months_data:
-                income = 0
-                expense = 0
-                values = data.get('values', {})
-                
-                for mc, subs in values.items():
-                    for sc, items in subs.items():
-                        for item, val in items.items():
-                            amt = ensure_float(val.get('amount', 0))
-                            if "Einnahmen" in mc:
-                                income += amt
-                            else:
-                                expense += amt
-                
-                incomes.append(income)
-                expenses.append(expense)
-                balances.append(income - expense)
-            
-            x = range(len(labels))
-            ax1.plot(x, incomes, marker='o', label='Einnahmen', color='#107c10', linewidth=2)
-            ax1.plot(x, expenses, marker='s', label='Ausgaben', color='#d13438', linewidth=2)
-            ax1.plot(x, balances, marker='^', label='Saldo', color='#0078d4', linewidth=2)
-            
-            ax1.set_xticks(x)
-            ax1.set_xticklabels(labels, rotation=45)
-            ax1.set_ylabel('Betrag (€)')
-            ax1.legend()
-            ax1.grid(True, alpha=0.3)
-            
-            text_color = self.colors['fg']
-            ax1.tick_params(colors=text_color)
-            ax1.yaxis.label.set_color(text_color)
-            ax1.xaxis.label.set_color(text_color)
-            for spine in ax1.spines.values():
-                spine.set_color(text_color)
+        # Chart 1: Verlauf - vorhandene Linien bekommen nur neue Daten
+        ax1 = self.ax1
+        labels = [m[0] for m in months_data]
+        incomes = np.array([s[0] for _, s in months_data])
+        expenses = np.array([s[1] for _, s in months_data])
+        balances = incomes - expenses
+        x = np.arange(len(labels))
+        
+        self._line_income.set_data(x, incomes)
+        self._line_expense.set_data(x, expenses)
+        self._line_balance.set_data(x, balances)
+        ax1.set_xticks(x)
+        ax1.set_xticklabels(labels, rotation=45)
+        self._legend1.set_visible(bool(months_data))
+        ax1.relim()
+        ax1.autoscale_view()
         
         self.fig1.tight_layout()
-        self.canvas1.draw()
+        self.canvas1.draw_idle()
         
         # Chart 2: Pie
-        self.fig2.clear()
-        ax2 = self.fig2.add_subplot(111)
+        ax2 = self.ax2
+        ax2.clear()
         
-        categories = {}
-        for (mc, sc, item), refs in self.labels_by_item.items():
-            if "Einnahmen" not in mc:
-                amt = ensure_float(refs['amt'].get())
-                if amt > 0:
-                    categories[mc] = categories.get(mc, 0) + amt
+        # nur positive Beträge je Hauptkategorie
+        positive = sum_by_group(np.clip(self.amounts, 0.0, None), self._item_main, len(self._main_names))
+        categories = {mc: amt for mc, amt in zip(self._main_names, positive.tolist())
+                      if "Einnahmen" not in mc and amt > 0}
         
         if categories:
             labels_pie = list(categories.keys())
@@ -1068,7 +1450,9 @@ class BudgetApp:
                    colors=colors_pie[:len(labels_pie)])
             ax2.axis('equal')
         
-        self.canvas2.draw()
+        self.canvas2.draw_idle()
+        self._charts_dirty = False
+        self._charts_key = charts_key
 
     def update_year_overview(self):
         """Aktualisiert Jahresübersicht"""
@@ -1078,49 +1462,17 @@ class BudgetApp:
             messagebox.showerror("Fehler", "Ungültiges Jahr")
             return
         
-        yearly_data = []
-        for month in range(1, 13):
-            month_str = f"{year}-{month:02d}"
-            fname = filename_for_month(self.current_profile.get(), month_str)
-            
-            if os.path.exists(fname):
-                try:
-                    with open(fname, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    yearly_data.append((month_str, data))
-                except:
-                    pass
+        yearly_data = self.month_summaries([f"{year}-{month:02d}" for month in range(1, 13)])
         
         if not yearly_data:
             messagebox.showinfo("Info", f"Keine Daten für {year} gefunden")
             return
         
-        # Berechne Jahreswerte
-        total_income = 0
-        total_expense = 0
-        monthly_incomes = []
-        monthly_expenses = []
-        month_labels = []
-        
-        for month_str, data in yearly_data:
-            income = 0
-            expense = 0
-            values = data.get('values', {})
-            
-            for mc, subs in values.items():
-                for sc, items in subs.items():
-                    for item, val in items.items():
-                        amt = ensure_float(val.get('amount', 0))
-                        if "Einnahmen" in mc:
-                            income += amt
-                        else:
-                            expense += amt
-            
-            total_income += income
-            total_expense += expense
-            monthly_incomes.append(income)
-            monthly_expenses.append(expense)
-            month_labels.append(month_str)
+        # Berechne Jahreswerte (Zeilen = Monate, Spalten = Einnahmen/Ausgaben)
+        month_labels = [month_str for month_str, _ in yearly_data]
+        totals = np.array([summary for _, summary in yearly_data], dtype=np.float64)
+        monthly_incomes, monthly_expenses = totals[:, 0], totals[:, 1]
+        total_income, total_expense = totals.sum(axis=0)
         
         balance = total_income - total_expense
         num_months = len(yearly_data)
@@ -1140,14 +1492,14 @@ class BudgetApp:
         self.avg_balance_label.config(text=f"Ø Saldo: {avg_balance:.2f} €")
         
         # Chart
-        self.fig_year.clear()
-        ax = self.fig_year.add_subplot(111)
+        ax = self.ax_year
+        ax.clear()
         
-        x = range(len(month_labels))
+        x = np.arange(len(month_labels))
         width = 0.35
         
-        ax.bar([i - width/2 for i in x], monthly_incomes, width, label='Einnahmen', color='#107c10')
-        ax.bar([i + width/2 for i in x], monthly_expenses, width, label='Ausgaben', color='#d13438')
+        ax.bar(x - width/2, monthly_incomes, width, label='Einnahmen', color='#107c10')
+        ax.bar(x + width/2, monthly_expenses, width, label='Ausgaben', color='#d13438')
         
         ax.set_xlabel('Monat')
         ax.set_ylabel('Betrag (€)')
@@ -1157,16 +1509,10 @@ class BudgetApp:
         ax.legend()
         ax.grid(True, alpha=0.3, axis='y')
         
-        text_color = self.colors['fg']
-        ax.tick_params(colors=text_color)
-        ax.title.set_color(text_color)
-        ax.yaxis.label.set_color(text_color)
-        ax.xaxis.label.set_color(text_color)
-        for spine in ax.spines.values():
-            spine.set_color(text_color)
+        self._style_axes(ax)
         
         self.fig_year.tight_layout()
-        self.canvas_year.draw()
+        self.canvas_year.draw_idle()
 
     def update_trends(self):
         """Berechnet Trends und Prognosen"""
@@ -1176,27 +1522,7 @@ class BudgetApp:
             forecast_months = 3
         
         # Sammle letzte 6 Monate für Trendberechnung
-        months_data = []
-        current = self.current_month.get()
-        
-        for i in range(6):
-            month = current
-            for _ in range(i):
-                month = get_previous_month(month)
-                if not month:
-                    break
-            
-            if not month:
-                break
-            
-            fname = filename_for_month(self.current_profile.get(), month)
-            if os.path.exists(fname):
-                try:
-                    with open(fname, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    months_data.append((month, data))
-                except:
-                    pass
+        months_data = self.month_summaries(previous_months(self.selected_month(), 6))
         
         if len(months_data) < 3:
             messagebox.showinfo("Info", "Mindestens 3 Monate Daten benötigt für Prognosen")
@@ -1205,38 +1531,13 @@ class BudgetApp:
         months_data.reverse()
         
         # Extrahiere Einnahmen/Ausgaben
-        incomes = []
-        expenses = []
-        labels = []
-        
-        for month, data in months_data:
-            income = 0
-            expense = 0
-            values = data.get('values', {})
-            
-            for mc, subs in values.items():
-                for sc, items in subs.items():
-                    for item, val in items.items():
-                        amt = ensure_float(val.get('amount', 0))
-                        if "Einnahmen" in mc:
-                            income += amt
-                        else:
-                            expense += amt
-            
-            incomes.append(income)
-            expenses.append(expense)
-            labels.append(month)
+        labels = [month for month, _ in months_data]
+        series = np.array([summary for _, summary in months_data], dtype=np.float64)
+        incomes, expenses = series[:, 0], series[:, 1]
         
-        # Lineare Regression für Prognose
+        # Lineare Regression für Prognose: geschlossene Form für beide Spalten zugleich
         x = np.arange(len(incomes))
-        
-        # Trend Einnahmen
-        z_income = np.polyfit(x, incomes, 1)
-        p_income = np.poly1d(z_income)
-        
-        # Trend Ausgaben
-        z_expense = np.polyfit(x, expenses, 1)
-        p_expense = np.poly1d(z_expense)
+        slope, intercept = linear_trend(series)
         
         # Prognose für kommende Monate
         future_x = np.arange(len(incomes), len(incomes) + forecast_months)
@@ -1246,14 +1547,14 @@ class BudgetApp:
             future_labels.append(next_month)
             next_month = get_next_month(next_month)
         
-        forecast_incomes = p_income(future_x)
-        forecast_expenses = p_expense(future_x)
+        all_x = np.concatenate([x, future_x])
+        trend = np.outer(all_x, slope) + intercept  # Zeilen = Monate, Spalten = Einnahmen/Ausgaben
+        forecast_incomes, forecast_expenses = trend[len(x):, 0], trend[len(x):, 1]
         
         # Chart erstellen
-        self.fig_trend.clear()
-        ax = self.fig_trend.add_subplot(111)
+        ax = self.ax_trend
+        ax.clear()
         
-        all_x = np.concatenate([x, future_x])
         all_labels = labels + future_labels
         
         # Historische Daten
@@ -1261,8 +1562,8 @@ class BudgetApp:
         ax.plot(x, expenses, marker='s', label='Ausgaben (Ist)', color='#d13438', linewidth=2)
         
         # Trendlinien
-        ax.plot(all_x, p_income(all_x), '--', label='Trend Einnahmen', color='#107c10', alpha=0.7)
-        ax.plot(all_x, p_expense(all_x), '--', label='Trend Ausgaben', color='#d13438', alpha=0.7)
+        ax.plot(all_x, trend[:, 0], '--', label='Trend Einnahmen', color='#107c10', alpha=0.7)
+        ax.plot(all_x, trend[:, 1], '--', label='Trend Ausgaben', color='#d13438', alpha=0.7)
         
         # Prognose
         ax.plot(future_x, forecast_incomes, marker='o', label='Prognose Einnahmen', 
@@ -1281,36 +1582,34 @@ class BudgetApp:
         ax.legend()
         ax.grid(True, alpha=0.3)
         
-        text_color = self.colors['fg']
-        ax.tick_params(colors=text_color)
-        ax.title.set_color(text_color)
-        ax.yaxis.label.set_color(text_color)
-        ax.xaxis.label.set_color(text_color)
-        for spine in ax.spines.values():
-            spine.set_color(text_color)
+        self._style_axes(ax)
         
         self.fig_trend.tight_layout()
-        self.canvas_trend.draw()
+        self.canvas_trend.draw_idle()
 
     def on_save_click(self):
         """Speichert den aktuellen Monat"""
-        ym = month_key_from_selection(self.current_month.get())
+        ym = self.selected_month()
         if not validate_month_format(ym):
             messagebox.showerror("Ungültiges Format", "Bitte Format YYYY-MM verwenden (z.B. 2025-01)")
             return
             
         fname = filename_for_month(self.current_profile.get(), ym)
-        payload = {"structure": self.structure, "values": {}}
+        payload = {"structure": copy_structure(self.structure), "values": {}}
         
         for (mc, sc, item), varsd in self.labels_by_item.items():
             amt = varsd["amt"].get().strip()
             note = varsd["note"].get().strip()
+            # leere Posten weglassen - beim Laden ergibt ein fehlender Eintrag ohnehin "0" ohne Notiz
+            if amt in ("", "0") and not note:
+                continue
             payload["values"].setdefault(mc, {}).setdefault(sc, {})[item] = {"amount": amt, "note": note}
         
         try:
             ensure_dir(os.path.dirname(fname))
-            with open(fname, "w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2, ensure_ascii=False)
+            self._enqueue_write(fname, month_file_blobs(payload), write_month_blobs)
+            self._cache_month((self.current_profile.get(), ym), payload)
+            self._charts_dirty = True
             self.save_settings()
             messagebox.showinfo("✅ Gespeichert", f"Daten gespeichert für {ym}")
         except Exception as e:
@@ -1318,148 +1617,265 @@ class BudgetApp:
 
     def on_load_click(self):
         """Lädt einen Monat"""
-        ym = self.current_month.get()
+        ym = self.selected_month()
         if not validate_month_format(ym):
             messagebox.showerror("Ungültiges Format", "Bitte Format YYYY-MM verwenden (z.B. 2025-01)")
             return
+        self.current_month.set(ym)  # bereinigten Wert im Eingabefeld anzeigen
         self.load_month(ym)
 
+    def _month_entry(self, ym, need_payload=True):
+        """Cache-Eintrag [stand, payload, summen] einer Monatsdatei, None wenn nicht vorhanden"""
+        # need_payload=False: Summen genügen, die Monatsdatei wird nur ohne aktuelle Summen-Datei gelesen
+        key = (self.current_profile.get(), ym)
+        entry = self._month_cache.get(key)
+        if entry is None and ym not in self._present_months(key[0]):
+            return None
+        
+        fname = filename_for_month(*key)
+        try:
+            stamp = stat_stamp(os.stat(fname))
+        except OSError:
+            stamp = None
+        
+        if entry is not None:
+            if entry[0] is None and stamp is not None:
+                # selbst gespeichert: Stand übernehmen, sobald der Hintergrund-Schreiber fertig ist
+                with self._write_lock:
+                    if fname not in self._pending_writes:
+                        entry[0] = stamp
+            if entry[0] is None or entry[0] == stamp:
+                if entry[1] is None and need_payload:
+                    entry[1] = read_month_file(fname)
+                self._month_cache.move_to_end(key)
+                return entry
+        
+        if stamp is None:
+            return None
+        stamp, payload, totals = load_month_files(fname, need_payload)
+        entry = [stamp, payload, totals]
+        self._store_month_entry(key, entry)
+        return entry
+
+    def _prefetch_months(self, months):
+        """Liest noch nicht zwischengespeicherte Monate (Summen) parallel im Thread-Pool ein"""
+        profile = self.current_profile.get()
+        present = self._present_months(profile)
+        todo = [ym for ym in months if ym in present and (profile, ym) not in self._month_cache]
+        if len(todo) < 2:
+            return
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS)
+        futures = [(ym, self._io_pool.submit(load_month_files, filename_for_month(profile, ym), False))
+                   for ym in todo]
+        for ym, future in futures:
+            try:
+                stamp, payload, totals = future.result()
+            except Exception:
+                continue  # Fehler meldet später der normale Lesepfad
+            self._store_month_entry((profile, ym), [stamp, payload, totals])
+
+    def _present_months(self, profile):
+        """Monate mit Datei im Profilordner - per scandir, neu eingelesen nur wenn sich der Ordner geändert hat"""
+        folder = profile_folder(profile)
+        try:
+            mtime = os.stat(folder).st_mtime_ns
+        except OSError:
+            return set()
+        cached = self._present_cache.get(profile)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        months = set()
+        with os.scandir(folder) as entries:
+            for e in entries:
+                m = _MONTH_FILE_RE.match(e.name)
+                if m:
+                    months.add(m.group(1))
+        self._present_cache[profile] = (mtime, months)
+        return months
+
+    def read_month(self, ym):
+        """Liest eine Monatsdatei über den LRU-Cache (Ergebnis nicht verändern), None wenn nicht vorhanden"""
+        entry = self._month_entry(ym)
+        return entry[1] if entry is not None else None
+
+    def month_summaries(self, months):
+        """[(Monat, (Einnahmen, Ausgaben))] der vorhandenen Monate - fehlende Summen in einem month_totals-Aufruf"""
+        self._prefetch_months(months)
+        entries = []
+        for ym in months:
+            try:
+                entry = self._month_entry(ym, need_payload=False)
+            except Exception:
+                continue  # unlesbare Monatsdatei auslassen
+            if entry is None or (entry[2] is None and not valid_month_payload(entry[1])):
+                continue  # fehlende oder fehlerhafte Monatsdatei auslassen
+            entries.append((ym, entry))
+        
+        missing = [entry for _, entry in entries if entry[2] is None]
+        if missing:
+            incomes, expenses = month_totals([entry[1] for entry in missing])
+            for entry, income, expense in zip(missing, incomes.tolist(), expenses.tolist()):
+                entry[2] = (income, expense)
+        return [(ym, entry[2]) for ym, entry in entries]
+
+    def _cache_month(self, key, payload):
+        """Übernimmt gerade gespeicherte Monatsdaten in den Cache"""
+        self._store_month_entry(key, [None, payload, None])
+
+    def _store_month_entry(self, key, entry):
+        """Legt einen Eintrag im LRU-Cache ab und verdrängt die ältesten Einträge"""
+        self._month_cache[key] = entry
+        self._month_cache.move_to_end(key)
+        while len(self._month_cache) > MONTH_CACHE_SIZE:
+            self._month_cache.popitem(last=False)
+
     def load_month(self, ym):
         """Lädt Monatsdaten"""
-        fname = filename_for_month(self.current_profile.get(), ym)
-        if not os.path.exists(fname):
-            for refs in self.labels_by_item.values():
-                refs["amt"].set("0")
-                refs["note"].set("")
+        try:
+            payload = self.read_month(ym)
+        except Exception as e:
+            messagebox.showerror("Fehler beim Laden", str(e))
+            return
+        
+        if payload is None:
+            self.fill_values({})
             messagebox.showinfo("Neu", f"Keine Daten für {ym} gefunden.\nNeuer Monat erstellt.")
             self.recalculate_all()
             return
         
         try:
-            with open(fname, "r", encoding="utf-8") as f:
-                payload = json.load(f)
-            
-            if "structure" in payload:
-                self.structure = payload["structure"]
+            # gleiche Struktur: keine Kopie, kein Settings-Schreiben, kein UI-Neuaufbau
+            if "structure" in payload and payload["structure"] != self.structure:
+                self.structure = copy_structure(payload["structure"])
+                self.mark_settings_dirty()
             
             self.build_categories_ui()
-            values = payload.get("values", {})
-            
-            for (mc, sc, item), refs in self.labels_by_item.items():
-                v = values.get(mc, {}).get(sc, {}).get(item, {})
-                refs["amt"].set(v.get("amount", "0"))
-                refs["note"].set(v.get("note", ""))
+            self.fill_values(payload.get("values", {}))
             
             messagebox.showinfo("✅ Geladen", f"Daten für {ym} geladen!")
             self.recalculate_all()
         except Exception as e:
             messagebox.showerror("Fehler beim Laden", str(e))
 
+    def fill_values(self, values):
+        """Überträgt Monatswerte in alle Eingabefelder mit einem einzigen Tcl-Aufruf"""
+        flat = []
+        for (mc, sc, item), refs in self.labels_by_item.items():
+            v = values.get(mc, {}).get(sc, {}).get(item, {})
+            amt = v.get("amount", "0")
+            flat.extend((str(refs["amt"]), amt, str(refs["note"]), v.get("note", "")))
+            self.amounts[self._item_index[(mc, sc, item)]] = ensure_float(amt)
+        if flat:
+            self.root.tk.call("foreach", ("name", "value"), tuple(flat), "set $name $value")
+
+    def set_amount(self, key, value):
+        """Setzt einen Betrag programmatisch und hält den geparsten Wert aktuell"""
+        self.labels_by_item[key]["amt"].set(value)
+        self.amounts[self._item_index[key]] = ensure_float(value)
+
+    def _on_amt_commit(self, event):
+        """<FocusOut>/<Return> eines Betragsfelds"""
+        key = getattr(event.widget, "_budget_key", None)
+        if key in self.labels_by_item:
+            self.on_amount_change(key)
+
     def on_amount_change(self, key):
-        """Callback bei Wertänderung"""
+        """Callback bei Wertänderung - parst nur den geänderten Betrag"""
+        idx = self._item_index[key]
+        value = ensure_float(self.labels_by_item[key]["amt"].get())
+        if value == self.amounts[idx]:
+            return  # z.B. Fokuswechsel ohne Änderung: Summen bleiben gleich
+        self.amounts[idx] = value
+        self._schedule_recalc()
+
+    def _schedule_recalc(self):
+        """Fasst schnelle Eingaben zu einer einzigen Neuberechnung zusammen"""
+        if self._recalc_after_id is not None:
+            self.root.after_cancel(self._recalc_after_id)
+        self._recalc_after_id = self.root.after(RECALC_DELAY_MS, self._do_recalc)
+
+    def _do_recalc(self):
+        self._recalc_after_id = None
         self.recalculate_all()
 
+    def _update_label(self, lbl, **opts):
+        """Konfiguriert ein Label nur, wenn sich Text/Farbe gegenüber der letzten Anzeige geändert haben"""
+        if getattr(lbl, "_shown_opts", None) != opts:
+            lbl.config(**opts)
+            lbl._shown_opts = opts
+
     def recalculate_all(self):
         """Neuberechnung aller Werte"""
-        total_income = 0.0
-        total_expense = 0.0
-        fixed_total = 0.0
-        variable_total = 0.0
-        per_item_amount = {}
-
-        for (mc, sc, item), refs in self.labels_by_item.items():
-            amt_str = refs["amt"].get()
-            amt = ensure_float(amt_str)
-            per_item_amount[(mc, sc, item)] = amt
-
-            if "Einnahmen" in mc or mc.lower().startswith("ein"):
-                total_income += amt
-            elif "Fix" in mc or mc.lower().startswith("fix"):
-                fixed_total += amt
-                total_expense += amt
-            elif "Variable" in mc or mc.lower().startswith("var"):
-                variable_total += amt
-                total_expense += amt
-            elif mc == "Sparen":
-                total_expense += amt
-                variable_total += amt
-            else:
-                total_expense += amt
-                variable_total += amt
+        self._charts_dirty = True  # Werte können sich geändert haben
+        kind_sums = sum_by_group(self.amounts, self._item_kind, 3)
+        total_income = float(kind_sums[KIND_INCOME])
+        fixed_total = float(kind_sums[KIND_FIXED])
+        variable_total = float(kind_sums[KIND_VARIABLE])
+        total_expense = fixed_total + variable_total
 
-        per_main = {}
-        for (mc, sc, item), amt in per_item_amount.items():
-            per_main.setdefault(mc, 0.0)
-            per_main[mc] += amt
+        main_sums = sum_by_group(self.amounts, self._item_main, len(self._main_names))
 
-        self.income_label.config(text=f"{total_income:.2f} €")
-        self.expense_label.config(text=f"{total_expense:.2f} €")
+        self._update_label(self.income_label, text=f"{total_income:.2f} €")
+        self._update_label(self.expense_label, text=f"{total_expense:.2f} €")
         balance = total_income - total_expense
         bal_color = self.colors['success'] if balance >= 0 else self.colors['danger']
-        self.balance_label.config(text=f"{balance:.2f} €", foreground=bal_color)
+        self._update_label(self.balance_label, text=f"{balance:.2f} €", foreground=bal_color)
 
         goal = ensure_float(self.savings_goal.get())
-        progress = min(max(balance, 0.0), goal) if goal > 0 else 0.0
-        pct = (progress / goal * 100.0) if goal > 0 else 0.0
-        self.savings_progress.config(text=f"Fortschritt: {progress:.2f} / {goal:.2f} ({pct:.1f}%)")
+        # Zusatzinfos nur neu formatieren, wenn sich eine ihrer Eingangsgrößen geändert hat
+        summary_key = (balance, goal, total_income, fixed_total, variable_total)
+        if summary_key != self._last_summary_key:
+            self._last_summary_key = summary_key
+            progress = min(max(balance, 0.0), goal) if goal > 0 else 0.0
+            pct = (progress / goal * 100.0) if goal > 0 else 0.0
+            self._update_label(self.savings_progress, text=f"Fortschritt: {progress:.2f} / {goal:.2f} ({pct:.1f}%)")
 
-        saving_rate = (balance / total_income * 100.0) if total_income > 0 else 0.0
-        self.saving_rate_label.config(text=f"📈 Sparquote: {saving_rate:.1f} %")
+            saving_rate = (balance / total_income * 100.0) if total_income > 0 else 0.0
+            self._update_label(self.saving_rate_label, text=f"📈 Sparquote: {saving_rate:.1f} %")
 
-        self.fixed_var_label.config(text=f"🔒 Fixkosten: {fixed_total:.2f} €")
-        self.variable_var_label.config(text=f"🔄 Variable Kosten: {variable_total:.2f} €")
+            self._update_label(self.fixed_var_label, text=f"🔒 Fixkosten: {fixed_total:.2f} €")
+            self._update_label(self.variable_var_label, text=f"🔄 Variable Kosten: {variable_total:.2f} €")
 
         # Update category sums mit Budget-Warnung
-        for mc, lbl in self.totals_per_category.items():
-            mc_sum = per_main.get(mc, 0.0)
+        for mc, lbl, mc_sum in zip(self._main_names, self._total_labels, main_sums.tolist()):
             budget_limit = self.budget_warnings.get(mc)
             
             if budget_limit and mc_sum > budget_limit:
-                lbl.config(text=f"⚠️ Summe: {mc_sum:.2f} € (Limit: {budget_limit})", 
-                          fg=self.colors['danger'])
+                self._update_label(lbl, text=f"⚠️ Summe: {mc_sum:.2f} € (Limit: {budget_limit})",
+                                   fg=self.colors['danger'])
             else:
-                lbl.config(text=f"Summe: {mc_sum:.2f} €", fg=self.colors['warning'])
+                self._update_label(lbl, text=f"Summe: {mc_sum:.2f} €", fg=self.colors['warning'])
 
         # Top-3
-        expense_by_sub = {}
-        for (mc, sc, item), amt in per_item_amount.items():
-            if "Einnahmen" in mc or mc.lower().startswith("ein"):
-                continue
-            key = f"{mc} / {sc}"
-            expense_by_sub.setdefault(key, 0.0)
-            expense_by_sub[key] += amt
-
-        top3 = sorted(expense_by_sub.items(), key=lambda x: x[1], reverse=True)[:3]
+        sub_sums = sum_by_group(self.amounts, self._item_sub, len(self._sub_names))[self._expense_subs]
+        # stabil sortiert: bei gleichen Beträgen bleibt die Reihenfolge der Struktur erhalten
+        top3 = [(self._sub_names[self._expense_subs[i]], float(sub_sums[i]))
+                for i in np.argsort(-sub_sums, kind='stable')[:3]]
         for i in range(3):
             if i < len(top3):
                 name, amt = top3[i]
-                self.top3_boxes[i].config(text=f"{i+1}. {name}: {amt:.2f} €")
+                self._update_label(self.top3_boxes[i], text=f"{i+1}. {name}: {amt:.2f} €")
             else:
-                self.top3_boxes[i].config(text=f"{i+1}. -")
+                self._update_label(self.top3_boxes[i], text=f"{i+1}. -")
 
     def export_csv(self):
         """CSV Export"""
         file = filedialog.asksaveasfilename(
             defaultextension=".csv",
             filetypes=[("CSV Dateien", "*.csv")],
-            initialfile=f"budget_{self.current_month.get()}.csv"
+            initialfile=f"budget_{self.selected_month()}.csv"
         )
         if not file:
             return
 
         try:
-            with open(file, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f, delimiter=';')
-                writer.writerow(["Hauptkategorie", "Unterkategorie", "Posten", "Betrag", "Notiz"])
-
-                for (mc, sc, item), refs in self.labels_by_item.items():
-                    writer.writerow([
-                        mc,
-                        sc,
-                        item,
-                        refs["amt"].get().replace('.', ','),
-                        refs["note"].get()
-                    ])
+            rows = [["Hauptkategorie", "Unterkategorie", "Posten", "Betrag", "Notiz"]]
+            rows += [[mc, sc, item, refs["amt"].get().replace('.', ','), refs["note"].get()]
+                     for (mc, sc, item), refs in self.labels_by_item.items()]
+            with open(file, "w", newline="", encoding="utf-8", buffering=1 << 16) as f:
+                csv.writer(f, delimiter=';').writerows(rows)
 
             messagebox.showinfo("✅ Export", f"CSV erfolgreich exportiert!")
         except Exception as e:
@@ -1467,36 +1883,45 @@ class BudgetApp:
 
     def export_pdf(self):
         """PDF Export"""
+        if not HAS_REPORTLAB:
+            messagebox.showerror("Fehler", "reportlab nicht installiert.\nInstalliere mit: pip install reportlab")
+            return
+        
         try:
-            from reportlab.lib.pagesizes import A4
-            from reportlab.pdfgen import canvas
-            from reportlab.lib.units import cm
-            
             file = filedialog.asksaveasfilename(
                 defaultextension=".pdf",
                 filetypes=[("PDF Dateien", "*.pdf")],
-                initialfile=f"budget_{self.current_month.get()}.pdf"
+                initialfile=f"budget_{self.selected_month()}.pdf"
             )
             if not file:
                 return
             
-            c = canvas.Canvas(file, pagesize=A4)
+            from reportlab.lib.pagesizes import A4
+            from reportlab.pdfgen import canvas as rl_canvas
+            from reportlab.lib.units import cm
+            
+            c = rl_canvas.Canvas(file, pagesize=A4)
             width, height = A4
             
             # Header
             c.setFont("Helvetica-Bold", 20)
-            c.drawString(2*cm, height - 2*cm, f"Budget-Report {self.current_month.get()}")
+            c.drawString(2*cm, height - 2*cm, f"Budget-Report {self.selected_month()}")
             
             y = height - 4*cm
             c.setFont("Helvetica", 12)
             
-            # Summary
-            total_income = sum(ensure_float(refs["amt"].get()) 
-                             for (mc, sc, item), refs in self.labels_by_item.items() 
-                             if "Einnahmen" in mc)
-            total_expense = sum(ensure_float(refs["amt"].get()) 
-                              for (mc, sc, item), refs in self.labels_by_item.items() 
-                              if "Einnahmen" not in mc)
+            # Summen und Detailzeilen in einem Durchlauf (Eingabefelder lesen: auch noch nicht bestätigte Werte)
+            total_income = total_expense = 0.0
+            details = []
+            for (mc, sc, item), refs in self.labels_by_item.items():
+                amt = refs["amt"].get()
+                val = ensure_float(amt)
+                if "Einnahmen" in mc:
+                    total_income += val
+                else:
+                    total_expense += val
+                if val > 0:
+                    details.append(f"{mc} > {sc} > {item}: {amt} EUR")
             
             c.drawString(2*cm, y, f"Einnahmen: {total_income:.2f} EUR")
             y -= 0.7*cm
@@ -1510,22 +1935,21 @@ class BudgetApp:
             c.drawString(2*cm, y, "Details:")
             y -= 1*cm
             
-            c.setFont("Helvetica", 10)
-            for (mc, sc, item), refs in self.labels_by_item.items():
-                amt = refs["amt"].get()
-                if ensure_float(amt) > 0:
-                    text = f"{mc} > {sc} > {item}: {amt} EUR"
-                    if y < 2*cm:
-                        c.showPage()
-                        y = height - 2*cm
-                    c.drawString(2*cm, y, text)
-                    y -= 0.5*cm
+            # ein Textobjekt je Seite statt einem drawString-Aufruf pro Zeile
+            lines = c.beginText(2*cm, y)
+            lines.setFont("Helvetica", 10, leading=0.5*cm)
+            for text in details:
+                if lines.getY() < 2*cm:
+                    c.drawText(lines)
+                    c.showPage()
+                    lines = c.beginText(2*cm, height - 2*cm)
+                    lines.setFont("Helvetica", 10, leading=0.5*cm)
+                lines.textLine(text)
+            c.drawText(lines)
             
             c.save()
             messagebox.showinfo("✅ Export", "PDF erfolgreich exportiert!")
             
-        except ImportError:
-            messagebox.showerror("Fehler", "reportlab nicht installiert.\nInstalliere mit: pip install reportlab")
         except Exception as e:
             messagebox.showerror("Fehler beim PDF Export", str(e))
 
@@ -1542,6 +1966,7 @@ def run_tests():
     assert ensure_float("123,45") == 123.45, "Test 1b failed"
     assert ensure_float("") == 0.0, "Test 1c failed"
     assert ensure_float("abc") == 0.0, "Test 1d failed"
+    assert ensure_float(12) == 12.0 and ensure_float(None) == 0.0, "Test 1e failed"
     print("✅ Test 1: ensure_float passed")
     
     # Test 2: validate_month_format
@@ -1549,6 +1974,7 @@ def run_tests():
     assert validate_month_format("2025-13") == False, "Test 2b failed"
     assert validate_month_format("2025-00") == False, "Test 2c failed"
     assert validate_month_format("abc") == False, "Test 2d failed"
+    assert not any(map(validate_month_format, ["2025-1a", "2025_01", "225-001", "2025-01\n", None])), "Test 2e failed"
     print("✅ Test 2: validate_month_format passed")
     
     # Test 3: get_previous_month
@@ -1559,8 +1985,123 @@ def run_tests():
     # Test 4: get_next_month
     assert get_next_month("2025-03") == "2025-04", "Test 4a failed"
     assert get_next_month("2025-12") == "2026-01", "Test 4b failed"
+    assert shift_month("2025-11", 14) == "2027-01" and shift_month("2025-02", -26) == "2022-12", "Test 4c failed"
+    assert shift_month("2025-1x", 1) is None, "Test 4d failed"
+    assert get_next_month("2025-1") == "2025-02" and not validate_month_format("2025-1"), "Test 4e failed"
     print("✅ Test 4: get_next_month passed")
     
+    # Test 5: parse_month
+    assert parse_month("2025-03") == (2025, 3), "Test 5a failed"
+    assert parse_month("2025-3") == (2025, 3) and parse_month("2025-") is None, "Test 5b failed"
+    assert parse_month(None) is None, "Test 5c failed"
+    print("✅ Test 5: parse_month passed")
+    
+    # Test 6: lighten_color
+    assert lighten_color("#0078d4") == "#148ce8", "Test 6a failed"
+    assert lighten_color("#ffffff") == "#ffffff", "Test 6b failed"
+    print("✅ Test 6: lighten_color passed")
+    
+    # Test 7: category_kind / sum_by_group
+    assert category_kind("Einnahmen") == KIND_INCOME, "Test 7a failed"
+    assert category_kind("Fixkosten") == KIND_FIXED, "Test 7b failed"
+    assert category_kind("Sparen") == KIND_VARIABLE, "Test 7c failed"
+    sums = sum_by_group(np.array([1.5, 2.0, 3.0]), np.array([0, 2, 0]), 3)
+    assert sums.tolist() == [4.5, 0.0, 2.0], "Test 7d failed"
+    print("✅ Test 7: category_kind / sum_by_group passed")
+    
+    # Test 8: month_totals
+    inc, exp = month_totals([
+        {"values": {"Einnahmen": {"Gehalt": {"A": {"amount": "100"}}},
+                    "Fixkosten": {"Wohnen": {"Miete": {"amount": "40,5"}}}}},
+        {"values": {}},
+    ])
+    assert inc.tolist() == [100.0, 0.0] and exp.tolist() == [40.5, 0.0], "Test 8a failed"
+    assert all(type(v) is float for v in month_totals([{"values": {}}])[0].tolist()), "Test 8b failed"
+    assert valid_month_payload({"values": {"Fixkosten": {"Wohnen": {"Miete": {"amount": "1"}}}}}), "Test 8c failed"
+    assert not any(map(valid_month_payload, [None, {"values": []}, {"values": {"Fixkosten": {"Wohnen": ["Miete"]}}}])), "Test 8d failed"
+    print("✅ Test 8: month_totals passed")
+    
+    # Test 9: Monatsdatei mit Summen-Datei
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp:
+        fname = os.path.join(tmp, "budget_2025-01.json")
+        payload = {"structure": {}, "values": {"Fixkosten": {"Wohnen": {"Miete": {"amount": "850", "note": ""}}}}}
+        write_month_file(fname, payload)
+        assert read_month_file(fname) == payload, "Test 9a failed"
+        with open(fname, 'r', encoding='utf-8') as f:
+            assert json.load(f) == payload, "Test 9b failed"
+        assert read_month_totals(fname, stat_stamp(os.stat(fname))) == (0.0, 850.0), "Test 9c failed"
+        stamp = os.path.getmtime(fname)
+        os.utime(fname, (stamp - 10, stamp - 10))
+        assert read_month_totals(fname, stat_stamp(os.stat(fname))) is None, "Test 9d failed"
+        # ersetzte Datei mit älterem Zeitstempel (Backup, cp -p): Summen-Datei gilt nicht mehr
+        restored = {"structure": {}, "values": {"Fixkosten": {"Wohnen": {"Miete": {"amount": "900", "note": ""}}}}}
+        stamp = os.path.getmtime(fname)
+        with open(fname, 'w', encoding='utf-8') as f:
+            json.dump(restored, f, indent=2)
+        os.utime(fname, (stamp - 60, stamp - 60))
+        assert read_month_file(fname) == restored, "Test 9e failed"
+        assert read_month_totals(fname, stat_stamp(os.stat(fname))) is None, "Test 9f failed"
+    print("✅ Test 9: read_month_file / write_month_file passed")
+    
+    # Test 10: category_icon
+    assert category_icon("Fixkosten") == "🏠", "Test 10a failed"
+    assert category_icon("Meine Einnahmen") == "💰", "Test 10b failed"
+    assert category_icon("Hobby") == "🎯", "Test 10c failed"
+    print("✅ Test 10: category_icon passed")
+    
+    # Test 11: encode_json
+    data = {"Einnahmen": {"Gehalt": {"Bonus für März": {"amount": "1,5", "note": ""}}}}
+    compact = encode_json(data)
+    assert json.loads(compact.decode('utf-8')) == data, "Test 11a failed"
+    assert b" " not in compact.replace("Bonus für März".encode('utf-8'), b""), "Test 11b failed"
+    assert "für".encode('utf-8') in compact, "Test 11c failed"
+    assert b"\n  " in encode_json(data, pretty=True), "Test 11d failed"
+    assert decode_json(compact) == data == decode_json(encode_json(data, pretty=True)), "Test 11e failed"
+    assert encode_json({"b": 1, "a": [2]}, sort_keys=True) == b'{"a":[2],"b":1}', "Test 11f failed"
+    print("✅ Test 11: encode_json passed")
+    
+    # Test 12: previous_months
+    assert previous_months("2025-02", 3) == ["2025-02", "2025-01", "2024-12"], "Test 12a failed"
+    assert previous_months("invalid", 3) == ["invalid"], "Test 12b failed"
+    print("✅ Test 12: previous_months passed")
+    
+    # Test 13: bank_amounts
+    rows = [["a", "-1.234,50"], ["b", "12,00"], ["c", "0"], ["d"], ["e", "x"], ["f", ""]]
+    assert bank_amounts(rows, 1, 2).tolist() == [-1234.5, 12.0, 0.0, 0.0, 0.0], "Test 13a failed"
+    assert bank_amounts([], 1, 2).size == 0, "Test 13b failed"
+    print("✅ Test 13: bank_amounts passed")
+    
+    # Test 14: copy_structure
+    copied = copy_structure(DEFAULT_STRUCTURE)
+    assert copied == DEFAULT_STRUCTURE, "Test 14a failed"
+    copied["Fixkosten"]["Wohnen"].append("Internet")
+    copied["Sparen"]["Neu"] = []
+    assert "Internet" not in DEFAULT_STRUCTURE["Fixkosten"]["Wohnen"], "Test 14b failed"
+    assert "Neu" not in DEFAULT_STRUCTURE["Sparen"], "Test 14c failed"
+    print("✅ Test 14: copy_structure passed")
+    
+    # Test 15: linear_trend
+    series = np.array([[1000.0, 800.0], [1100.0, 760.0], [1150.0, 790.0], [1300.0, 700.0]])
+    slope, intercept = linear_trend(series)
+    ref = np.polyfit(np.arange(4), series, 1)
+    assert np.allclose(slope, ref[0]) and np.allclose(intercept, ref[1]), "Test 15a failed"
+    assert np.allclose(linear_trend([2.0, 4.0, 6.0]), (2.0, 2.0)), "Test 15b failed"
+    print("✅ Test 15: linear_trend passed")
+    
+    # Test 16: Theme-Wechsel, wenn nur Jahres- und Trend-Tab aufgebaut sind (Statistik-Tab noch nie geöffnet)
+    from types import SimpleNamespace
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    fig_year, fig_trend = Figure(), Figure()
+    fig_year.add_subplot(111); fig_trend.add_subplot(111)
+    opened = SimpleNamespace(colors={'bg': '#123456', 'fg': '#abcdef'}, _figures=[
+        (fig_year, FigureCanvasAgg(fig_year), True), (fig_trend, FigureCanvasAgg(fig_trend), True)])
+    opened._style_axes = lambda ax: BudgetApp._style_axes(opened, ax)
+    BudgetApp._restyle_figures(opened)
+    assert all(f.get_facecolor()[:3] == (0x12 / 255, 0x34 / 255, 0x56 / 255) for f in (fig_year, fig_trend)), "Test 16a failed"
+    assert fig_trend.axes[0].title.get_color() == '#abcdef', "Test 16b failed"
+    print("✅ Test 16: _restyle_figures passed")
+    
     print("✅ All tests passed!")
 
 